@@ -1,14 +1,21 @@
 import subprocess
 import os
+import shutil
 import signal
 import time
 import datetime
 from pathlib import Path
+from typing import Optional
 import numpy as np
 from ..utils.paths import logs_dir
 
 CREATE_NEW_PROCESS_GROUP = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
 
+# Размер куска при потоковой записи temp-файла (кадр + gap)
+_WRITE_CHUNK = 1 << 20
+# Нулевой кусок для gap: создаётся один раз на процесс
+_ZERO_CHUNK = memoryview(bytes(_WRITE_CHUNK))
+
 
 # ==================== Утилиты для работы с IQ ====================
 
@@ -122,7 +129,7 @@ class HackRFTx:
 
     def run_loop(self, iq_path: Path, fs_tx: int, target_hz: int, tx_gain_db: int,
                  if_offset_hz: int = 0, freq_corr_hz: int = 0, pa_enabled: bool = False,
-                 mode: str = "loop", gap_s: float = 0.0):
+                 mode: str = "loop", gap_s: float = 0.0, iq: Optional[np.ndarray] = None):
         """
         Запуск hackrf_transfer (CLEAN IMPLEMENTATION - без конкатенаций).
 
@@ -136,6 +143,8 @@ class HackRFTx:
         - pa_enabled: включить PA (флаг -a 1)
         - mode: "loop" (с -R флагом) или "once" (без -R, один запуск)
         - gap_s: длительность gap в секундах (добавляется в конец кадра)
+        - iq: кадр IQ уже в памяти (complex). Тогда cf32-файл не пишется и не
+          читается: iq_path задаёт только имя temp sc8 и может не существовать
 
         АРХИТЕКТУРА (2025-10-25-TT-AIS_TX_buffer.md):
 
@@ -157,7 +166,7 @@ class HackRFTx:
         if self.is_running():
             raise RuntimeError("HackRF already running")
 
-        if not iq_path.exists():
+        if iq is None and not iq_path.exists():
             raise FileNotFoundError(f"IQ file not found: {iq_path}")
 
         # 1. Вычисляем частоты и цифровой сдвиг
@@ -165,12 +174,15 @@ class HackRFTx:
         digital_shift_hz = -(if_offset_hz + freq_corr_hz)
 
         # 2. Определяем формат
-        is_cf32 = iq_path.suffix.lower() in (".cf32", ".iq")
+        is_cf32 = iq is not None or iq_path.suffix.lower() in (".cf32", ".iq")
         metrics = {"rms": 0.0, "peak": 0.0}  # по умолчанию
 
         if is_cf32:
-            # 2A. Читаем cf32 файл
-            iq_cf32 = _read_cf32(iq_path)
+            # 2A. Читаем cf32 файл (если кадр не передан из памяти)
+            if iq is None:
+                iq_cf32 = _read_cf32(iq_path)
+            else:
+                iq_cf32 = np.asarray(iq, dtype=np.complex64)
 
             # Применяем цифровой сдвиг (IF компенсация)
             iq_cf32 = _apply_digital_shift(iq_cf32, digital_shift_hz, fs_tx)
@@ -183,27 +195,41 @@ class HackRFTx:
 
             # Сохраняем sc8 во временный файл (рядом с cf32)
             sc8_path = iq_path.with_suffix(".sc8")
-            with open(sc8_path, "wb") as f:
-                f.write(sc8_bytes)
+            sc8_path.write_bytes(sc8_bytes)
+            frame_len = len(sc8_bytes)
         else:
-            # 2B. Используем sc8 напрямую (обратная совместимость)
+            # 2B. Используем sc8 напрямую (обратная совместимость).
+            # В память не читаем: файл либо отдаётся hackrf_transfer как есть,
+            # либо копируется в temp ниже
             sc8_path = iq_path
-            sc8_bytes = sc8_path.read_bytes()
+            frame_len = sc8_path.stat().st_size
 
         # 3. Добавление gap (если задан)
         gap_samples = int(round(gap_s * fs_tx))
-        gap_sc8 = b"\x00" * (gap_samples * 2) if gap_samples > 0 else b""  # sc8: 2 bytes per sample
-
-        # Финальный буфер: кадр + gap
-        sc8_bytes_final = sc8_bytes + gap_sc8
-
-        # 4. Сохраняем в temp файл
-        suffix = "_loop" if mode == "loop" else "_once"
-        temp_sc8_path = sc8_path.with_name(sc8_path.stem + suffix + ".sc8")
-        with open(temp_sc8_path, "wb") as f:
-            f.write(sc8_bytes_final)
-
-        sc8_path_final = temp_sc8_path
+        gap_len = gap_samples * 2 if gap_samples > 0 else 0  # sc8: 2 bytes per sample
+
+        # 4. Без gap sc8-файл кадра и есть входной файл hackrf_transfer:
+        # вторая копия тех же байт не пишется.
+        # С gap — temp файл: кадр + gap. Gap пишется кусками из общего
+        # нулевого буфера, без склейки кадр+gap в памяти (8 с при 2 MS/s —
+        # это 32 МБ нулей).
+        if gap_len:
+            suffix = "_loop" if mode == "loop" else "_once"
+            temp_sc8_path = sc8_path.with_name(sc8_path.stem + suffix + ".sc8")
+            with open(temp_sc8_path, "wb", buffering=_WRITE_CHUNK) as f:
+                if is_cf32:
+                    f.write(sc8_bytes)
+                else:
+                    with open(sc8_path, "rb") as src:
+                        shutil.copyfileobj(src, f, _WRITE_CHUNK)
+                remaining = gap_len
+                while remaining > 0:
+                    n = min(remaining, _WRITE_CHUNK)
+                    f.write(_ZERO_CHUNK[:n])
+                    remaining -= n
+            sc8_path_final = temp_sc8_path
+        else:
+            sc8_path_final = sc8_path
 
         # 5. Определяем, использовать ли флаг -R
         use_loop_flag = (mode == "loop")
@@ -250,15 +276,15 @@ class HackRFTx:
         # 7. Логируем заголовок с метриками
         self._log(f"CMD: {' '.join(cmd)}")
         self._log(f"PID: {self.pid}")
-        self._log(f"INPUT: {iq_path} ({'cf32' if is_cf32 else 'sc8'})")
+        self._log(f"INPUT: {iq_path if iq is None else 'memory'} ({'cf32' if is_cf32 else 'sc8'})")
         self._log(f"IQ_SC8: {sc8_path_final}")
         self._log(f"OUTPUT: {output_path}")
         self._log("")
         self._log(f"=== Metrics ===")
         if is_cf32:
             self._log(f"CF32 samples: {iq_cf32.size}")
-        self._log(f"SC8 bytes (frame): {len(sc8_bytes)}")
-        self._log(f"SC8 bytes (final): {len(sc8_bytes_final)}")
+        self._log(f"SC8 bytes (frame): {frame_len}")
+        self._log(f"SC8 bytes (final): {frame_len + gap_len}")
         self._log(f"RMS: {metrics['rms']:.6f}")
         self._log(f"Peak: {metrics['peak']:.6f}")
         self._log(f"PA enabled: {pa_enabled}")
@@ -277,7 +303,7 @@ class HackRFTx:
         self._log(f"Mode: {mode}")
         self._log(f"Gap: {gap_s} s")
         self._log(f"Loop flag (-R): {use_loop_flag}")
-        frame_duration_s = len(sc8_bytes) / (fs_tx * 2)  # sc8: 2 bytes per sample
+        frame_duration_s = frame_len / (fs_tx * 2)  # sc8: 2 bytes per sample
         run_duration_s = frame_duration_s + gap_s
         self._log(f"Frame duration: {frame_duration_s:.3f} s")
         self._log(f"Run duration (frame+gap): {run_duration_s:.3f} s")
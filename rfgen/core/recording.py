@@ -1,3 +1,4 @@
+import mmap
 import numpy as np
 
 def save_cf32(path: str, iq: np.ndarray):
@@ -11,15 +12,23 @@ def save_cf32(path: str, iq: np.ndarray):
 
 def save_sc8(path: str, iq_c: np.ndarray):
     path = str(path)
-    iq = np.asarray(iq_c, dtype=np.complex64)
+    iq = np.ascontiguousarray(iq_c, dtype=np.complex64)
     mx = float(np.max(np.abs(iq))) if iq.size else 1.0
     if mx < 1e-12:
         mx = 1.0
     scale = 0.8 / mx  # keep headroom
-    I = np.clip(np.real(iq) * scale * 127.0, -128, 127).astype(np.int8)
-    Q = np.clip(np.imag(iq) * scale * 127.0, -128, 127).astype(np.int8)
-    inter = np.empty(I.size * 2, dtype=np.int8)
-    inter[0::2] = I
-    inter[1::2] = Q
-    inter.tofile(path)
+    # complex64 как float32 — это уже I,Q,I,Q...: масштаб и clip одним проходом
+    iq_f = iq.view(np.float32) * np.float32(scale * 127.0)
+    np.clip(iq_f, -128, 127, out=iq_f)
+    n = iq_f.size
+    with open(path, "w+b") as f:
+        if n == 0:
+            return path
+        # Файл сразу нужного размера; отсчёты пишутся прямо в отображение,
+        # без промежуточного int8-буфера
+        f.truncate(n)
+        with mmap.mmap(f.fileno(), n) as mm:
+            inter = np.frombuffer(mm, dtype=np.int8)
+            inter[:] = iq_f  # float32 -> int8 с отбрасыванием дробной части, как astype
+            del inter  # освободить буфер до закрытия mmap
     return path
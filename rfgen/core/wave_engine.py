@@ -347,6 +347,13 @@ def generate_base_signal(kind: str, fs: int, dur_s: float, tone_hz: float = 1000
         m = np.sin(2.0 * np.pi * tone_hz * t)
     return m, t
 
+def _expj(phase):
+    """exp(1j*phase) сразу в complex64: cos/sin пишутся в real/imag без complex128."""
+    out = np.empty(np.shape(phase), dtype=np.complex64)
+    np.cos(phase, out=out.real, casting="same_kind")
+    np.sin(phase, out=out.imag, casting="same_kind")
+    return out
+
 def mod_none(fs: int, m):
     # no modulation: constant carrier at baseband (I=1, Q=0)
     iq = np.ones_like(m, dtype=np.complex64)
@@ -359,7 +366,7 @@ def mod_am(fs: int, m, depth: float = 0.5):
 
 def mod_pm(fs: int, m, index_rad: float = 1.0):
     phase = index_rad * m
-    iq = np.exp(1j * phase).astype(np.complex64)
+    iq = _expj(phase)
     return iq
 
 def mod_fm(fs: int, m, deviation_hz: float = 5000.0):
@@ -368,7 +375,7 @@ def mod_fm(fs: int, m, deviation_hz: float = 5000.0):
     # instantaneous phase increment: 2*pi * f_inst / fs, where f_inst = deviation_hz * mm
     dphi = 2.0 * np.pi * deviation_hz * mm / float(fs)
     phase = np.cumsum(dphi, dtype=np.float64)
-    iq = np.exp(1j * phase).astype(np.complex64)
+    iq = _expj(phase)
     return iq
 
 def build_psk406(profile: dict) -> np.ndarray:
@@ -711,7 +718,9 @@ def build_iq(profile: dict, frame_s: float = 1.0):
         iq = mod_none(fs, m)
 
     # Scale to safe level (<= 0.8) to avoid DAC clipping later
-    iq = (0.8 * iq).astype(np.complex64)
+    # (модуляторы возвращают новый массив — масштабируем на месте)
+    iq = iq.astype(np.complex64, copy=False)
+    iq *= 0.8
     return iq
 
 def build_cw(profile: dict, frame_s: float = 1.0):
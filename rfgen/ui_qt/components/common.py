@@ -1,2 +1,33 @@
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
 def bind_signals():
     pass
+
+
+class TaskSignals(QObject):
+    finished = Signal(object)
+
+
+class BackgroundTask(QRunnable):
+    """Выполняет fn() в QThreadPool, результат приходит сигналом в GUI-поток.
+
+    Подключать finished к методу виджета (не к lambda), чтобы слот
+    вызывался в GUI-потоке через очередь событий. Если fn бросает
+    исключение, finished получает сам объект исключения — слот проверяет
+    isinstance(result, Exception).
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self.signals = TaskSignals()
+
+    def run(self):
+        # finished приходит всегда: иначе слот не узнал бы о сбое задачи
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            result = e
+        self.signals.finished.emit(result)
@@ -1,7 +1,6 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QListWidget, QStackedWidget, QListWidgetItem, QStatusBar
 )
-from PySide6.QtCore import Qt
 from .pages.page_gen_basic import PageGenBasic
 from .pages.page_ais import PageAIS
 from .pages.page_406 import Page406
@@ -7,11 +7,34 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from pathlib import Path
 import datetime
+import os
 
 from ...utils.paths import profiles_dir
-from ...utils.profile_io import validate_profile, apply_defaults, load_json, save_json
+from ...utils.profile_io import validate_profile, apply_defaults, load_json, save_json, peek_standard
 
 
+# Списки элементов комбобоксов (создаются один раз при импорте модуля)
+_CATEGORIES = ("Distress", "Urgency", "Safety", "Routine", "Test")
+_CALL_TYPES = (
+    "All Ships",
+    "Individual Station",
+    "Group Call",
+    "Area Call",
+)
+_NATURES = (
+    "Fire/Explosion",
+    "Flooding",
+    "Collision",
+    "Grounding",
+    "Listing",
+    "Sinking",
+    "Disabled and Adrift",
+    "Undesignated",
+    "Abandoning Ship",
+    "Piracy/Armed Robbery",
+    "Man Overboard",
+)
+
 class PageDSC_VHF(QWidget):
     """DSC VHF signal generator page.
 
@@ -88,16 +111,11 @@ class PageDSC_VHF(QWidget):
         call_layout = QFormLayout()
 
         self.combo_category = QComboBox()
-        self.combo_category.addItems(["Distress", "Urgency", "Safety", "Routine", "Test"])
+        self.combo_category.addItems(_CATEGORIES)
         call_layout.addRow("Category:", self.combo_category)
 
         self.combo_type = QComboBox()
-        self.combo_type.addItems([
-            "All Ships",
-            "Individual Station",
-            "Group Call",
-            "Area Call"
-        ])
+        self.combo_type.addItems(_CALL_TYPES)
         call_layout.addRow("Call Type:", self.combo_type)
 
         self.mmsi_from = QLineEdit("123456789")
@@ -135,19 +153,7 @@ class PageDSC_VHF(QWidget):
 
         # Message Builder fields (disabled by default)
         self.combo_nature = QComboBox()
-        self.combo_nature.addItems([
-            "Fire/Explosion",
-            "Flooding",
-            "Collision",
-            "Grounding",
-            "Listing",
-            "Sinking",
-            "Disabled and Adrift",
-            "Undesignated",
-            "Abandoning Ship",
-            "Piracy/Armed Robbery",
-            "Man Overboard"
-        ])
+        self.combo_nature.addItems(_NATURES)
         form_layout.addRow("Nature of Distress:", self.combo_nature)
 
         self.position = QLineEdit("0000.00N/00000.00E")
@@ -275,7 +281,11 @@ class PageDSC_VHF(QWidget):
     def _load_default_profile(self):
         """Auto-load default_dsc_vhf.json profile if it exists on startup."""
         default_path = profiles_dir() / "default_dsc_vhf.json"
-        if default_path.exists():
+        if default_path.is_file():
+            # Быстрая проверка по началу файла: чужой профиль даже не парсим
+            standard = peek_standard(default_path)
+            if standard is not None and standard != "dsc_vhf":
+                return
             data = load_json(default_path)
             if data:
                 # Verify it's the correct standard (safety check)
@@ -495,11 +505,11 @@ class PageDSC_VHF(QWidget):
         """Save current settings as profile."""
         prof = self._collect_profile()
 
-        default_path = str(profiles_dir() / "profile.json")
+        default_path = profiles_dir() / "profile.json"
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Profile",
-            default_path,
+            os.fspath(default_path),
             "Profiles (*.json)"
         )
 
@@ -519,12 +529,13 @@ class PageDSC_VHF(QWidget):
 
     def _load_profile(self):
         """Load profile from file."""
-        pdir = str(profiles_dir())
-        path, _ = QFileDialog.getOpenFileName(self, "Load Profile", pdir, "Profiles (*.json)")
-        if not path:
+        pdir = os.fspath(profiles_dir())
+        file_path, _ = QFileDialog.getOpenFileName(self, "Load Profile", pdir, "Profiles (*.json)")
+        if not file_path:
             return
 
-        data = load_json(Path(path))
+        path = Path(file_path)
+        data = load_json(path)
         if not data:
             QMessageBox.critical(self, "Load failed", "Can't read profile")
             return
@@ -535,7 +546,7 @@ class PageDSC_VHF(QWidget):
             return
 
         self._apply_profile_to_form(data)
-        self.status_label.setText(f"Profile loaded: {Path(path).name}")
+        self.status_label.setText(f"Profile loaded: {path.name}")
 
     def _apply_profile_to_form(self, p):
         """Map profile values to UI widgets."""
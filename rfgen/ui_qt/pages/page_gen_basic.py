@@ -3,16 +3,31 @@ from PySide6.QtWidgets import (
     QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox, QCheckBox, QGroupBox,
     QMessageBox, QFileDialog, QScrollArea
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from pathlib import Path
-import datetime
+from contextlib import contextmanager
+import hashlib
+import json
+import logging
+import re
+import time
 
-from ...core.wave_engine import build_iq, build_cw
-from ...backends.fileout import FileOutBackend
-from ...backends.hackrf import HackRFTx
 from ...utils.paths import profiles_dir, out_dir
 from ...utils.profile_io import validate_profile, apply_defaults, load_json, save_json
 
+log = logging.getLogger(__name__)
+
+# Элементы комбобоксов и обратные индексы text -> index (вместо findText)
+_BACKENDS = ("hackrf", "fileout")
+_MOD_TYPES = ("None", "FM", "PM", "AM")
+_PATTERNS = ("Tone", "Sweep", "FF00", "F0F0", "3333", "5555", "Noise")
+_BACKEND_IDX = {t: i for i, t in enumerate(_BACKENDS)}
+_MOD_IDX = {t: i for i, t in enumerate(_MOD_TYPES)}
+_PAT_IDX = {t: i for i, t in enumerate(_PATTERNS)}
+
+# Целое в поле ввода: проверка до int(), без ValueError на пустом/недописанном тексте
+_INT_RE = re.compile(r'\s*[+-]?\d+\s*')
+
 class PageGenBasic(QWidget):
     """Basic signal generator page (formerly Quick TX).
 
@@ -21,9 +36,13 @@ class PageGenBasic(QWidget):
     - Patterns: Tone, Sweep, Noise, FF00, F0F0, 3333, 5555
     - Loop mode for continuous transmission
     """
+    # Перенос legacy-профилей уже выполнялся в этом процессе (общий для экземпляров)
+    _migrated_this_session = False
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._hrf = None  # HackRF process handle wrapper
+        self._tx_busy = False  # идёт _start_tx (построение/запись кадра)
 
         # Главный layout для всей страницы
         main_layout = QVBoxLayout(self)
@@ -46,7 +65,7 @@ class PageGenBasic(QWidget):
         dev_group = QGroupBox("Device")
         dev_form = QFormLayout(dev_group)
         self.combo_backend = QComboBox()
-        self.combo_backend.addItems(["hackrf", "fileout"])
+        self.combo_backend.addItems(_BACKENDS)
         self.fs_tx = QSpinBox(); self.fs_tx.setRange(200_000, 20_000_000); self.fs_tx.setSingleStep(100_000); self.fs_tx.setValue(2_000_000)
         self.tx_gain = QSpinBox(); self.tx_gain.setRange(0, 60); self.tx_gain.setValue(30)
         self.pa_enable = QCheckBox("Enable PA")
@@ -68,7 +87,7 @@ class PageGenBasic(QWidget):
         # Modulation group
         mod_group = QGroupBox("Modulation")
         mod_form = QFormLayout(mod_group)
-        self.combo_mod = QComboBox(); self.combo_mod.addItems(["None", "FM", "PM", "AM"])
+        self.combo_mod = QComboBox(); self.combo_mod.addItems(_MOD_TYPES)
         self.deviation = QSpinBox(); self.deviation.setRange(0, 200_000); self.deviation.setValue(5000)
         self.pm_index = QDoubleSpinBox(); self.pm_index.setRange(0.0, 10.0); self.pm_index.setSingleStep(0.05); self.pm_index.setValue(1.0)
         self.am_depth = QDoubleSpinBox(); self.am_depth.setRange(0.0, 1.0); self.am_depth.setSingleStep(0.05); self.am_depth.setValue(0.5)
@@ -80,7 +99,7 @@ class PageGenBasic(QWidget):
         # Pattern group
         pat_group = QGroupBox("Pattern")
         pat_form = QFormLayout(pat_group)
-        self.combo_pat = QComboBox(); self.combo_pat.addItems(["Tone", "Sweep", "FF00", "F0F0", "3333", "5555", "Noise"])
+        self.combo_pat = QComboBox(); self.combo_pat.addItems(_PATTERNS)
         self.tone_hz = QSpinBox(); self.tone_hz.setRange(1, 100_000); self.tone_hz.setValue(1000)
         self.bitrate = QSpinBox(); self.bitrate.setRange(10, 1_000_000); self.bitrate.setValue(9600)
         pat_form.addRow("Type", self.combo_pat)
@@ -132,47 +151,96 @@ class PageGenBasic(QWidget):
         self.btn_start.clicked.connect(self._start_tx)
         self.btn_stop.clicked.connect(self._stop_tx)
 
-        # Auto-load default profile if exists
-        self._load_default_profile()
+        # Debounce: пересчёт после паузы в наборе, а не на каждое нажатие
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(200)
+        self._debounce.timeout.connect(self._on_edits_settled)
+        for edit in (self.target_hz, self.if_offset_hz, self.freq_corr_hz):
+            edit.textEdited.connect(lambda *_: self._debounce.start())
+        for spin in (self.fs_tx, self.tx_gain, self.deviation, self.pm_index, self.am_depth,
+                     self.tone_hz, self.bitrate, self.repeat, self.gap_s):
+            # valueChanged только по завершении ввода, без промежуточных "1", "16", "162"
+            spin.setKeyboardTracking(False)
+            spin.valueChanged.connect(lambda *_: self._debounce.start())
+
+        # Последний записанный кадр: (ключ параметров, путь SC8, mtime_ns)
+        self._last_iq = None
+
+        # Связанные методы чтения виджетов по блокам профиля (ключ, getter):
+        # value()/isChecked()/currentText() уже отдают int/float/bool/str
+        self._dev_getters = (("backend", self.combo_backend.currentText),
+                             ("fs_tx", self.fs_tx.value),
+                             ("tx_gain_db", self.tx_gain.value),
+                             ("pa", self.pa_enable.isChecked))
+        self._mod_getters = (("type", self.combo_mod.currentText),
+                             ("deviation_hz", self.deviation.value),
+                             ("pm_index", self.pm_index.value),
+                             ("am_depth", self.am_depth.value))
+        self._pat_getters = (("type", self.combo_pat.currentText),
+                             ("tone_hz", self.tone_hz.value),
+                             ("bitrate_bps", self.bitrate.value))
+        self._sched_getters = (("gap_s", self.gap_s.value),
+                               ("repeat", self.repeat.value))
+
+        # Кэш профиля: пересобирается только после изменения виджетов
+        self._profile_cache = None
+        self._profile_dirty = True
+        for combo in (self.combo_backend, self.combo_mod, self.combo_pat):
+            combo.currentIndexChanged.connect(self._mark_profile_dirty)
+        for spin in (self.fs_tx, self.tx_gain, self.deviation, self.pm_index, self.am_depth,
+                     self.tone_hz, self.bitrate, self.repeat, self.gap_s):
+            spin.valueChanged.connect(self._mark_profile_dirty)
+        for edit in (self.target_hz, self.if_offset_hz, self.freq_corr_hz):
+            edit.textChanged.connect(self._mark_profile_dirty)
+        for chk in (self.pa_enable, self.loop):
+            chk.toggled.connect(self._mark_profile_dirty)
+
+        # Auto-load default profile if exists (после первой отрисовки окна)
+        QTimer.singleShot(0, self._load_default_profile)
 
     # ---- helpers ----
+    def _on_edits_settled(self):
+        """Вызывается один раз после паузы в редактировании полей."""
+        for label, edit in (("Target (Hz)", self.target_hz),
+                            ("IF offset (Hz)", self.if_offset_hz),
+                            ("Freq corr (Hz)", self.freq_corr_hz)):
+            text = edit.text().strip()
+            if text and not _INT_RE.fullmatch(text):
+                self._status(f"Invalid number in {label}: '{text}'")
+                return
+
+    def _mark_profile_dirty(self, *_):
+        self._profile_dirty = True
+
     def _collect_profile(self):
+        """Собирает профиль из виджетов (кэшируется до следующего изменения формы).
+
+        Возвращаемый dict общий для всех вызовов — перед изменением копировать.
+        """
+        if not self._profile_dirty and self._profile_cache is not None:
+            return self._profile_cache
+
+        schedule = {"mode": "loop" if self.loop.isChecked() else "repeat"}
+        schedule.update((k, get()) for k, get in self._sched_getters)
+        device = {k: get() for k, get in self._dev_getters}
+        device["target_hz"] = self._safe_int(self.target_hz.text(), 0)
+        device["if_offset_hz"] = self._safe_int(self.if_offset_hz.text(), 0)
+        device["freq_corr_hz"] = self._safe_int(self.freq_corr_hz.text(), 0)
         profile = {
             "name": None,
             "standard": "generic",
-            "modulation": {
-                "type": self.combo_mod.currentText(),
-                "deviation_hz": int(self.deviation.value()),
-                "pm_index": float(self.pm_index.value()),
-                "am_depth": float(self.am_depth.value()),
-            },
-            "pattern": {
-                "type": self.combo_pat.currentText(),
-                "tone_hz": int(self.tone_hz.value()),
-                "bitrate_bps": int(self.bitrate.value()),
-            },
-            "schedule": {
-                "mode": "loop" if self.loop.isChecked() else "repeat",
-                "gap_s": float(self.gap_s.value()),
-                "repeat": int(self.repeat.value()),
-            },
-            "device": {
-                "backend": self.combo_backend.currentText(),
-                "fs_tx": int(self.fs_tx.value()),
-                "tx_gain_db": int(self.tx_gain.value()),
-                "pa": bool(self.pa_enable.isChecked()),
-                "target_hz": int(self._safe_int(self.target_hz.text(), 0)),
-                "if_offset_hz": int(self._safe_int(self.if_offset_hz.text(), 0)),
-                "freq_corr_hz": int(self._safe_int(self.freq_corr_hz.text(), 0)),
-            },
-            "_meta": {
-                "created_utc": datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z"
-            }
+            "modulation": {k: get() for k, get in self._mod_getters},
+            "pattern": {k: get() for k, get in self._pat_getters},
+            "schedule": schedule,
+            "device": device,
         }
+        self._profile_cache = profile
+        self._profile_dirty = False
         return profile
 
     def _save_profile_dialog(self):
-        prof = self._collect_profile()
+        prof = dict(self._collect_profile())  # копия: ниже меняем "name" и "_meta"
 
         # Open file save dialog in profiles directory
         pdir = str(profiles_dir())
@@ -196,6 +264,11 @@ class PageGenBasic(QWidget):
 
         # Extract profile name from filename (without extension)
         prof["name"] = out_path.stem
+        # Метка времени только при фактическом сохранении: кэш формы
+        # не содержит меняющихся полей
+        prof["_meta"] = {
+            "created_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        }
 
         # Save using utils
         if not save_json(out_path, prof):
@@ -215,14 +288,16 @@ class PageGenBasic(QWidget):
                     # Silently load - no status message on startup
 
     def _load_profile_dialog(self):
-        # Optional: migrate legacy profiles first
-        try:
-            from ...utils.migrate import migrate_legacy_profiles
-            result = migrate_legacy_profiles()
-            if result.get("migrated", 0) > 0:
-                self._status(f"Migrated {result['migrated']} legacy profiles to rfgen/profiles")
-        except ImportError:
-            pass  # migrate module doesn't exist yet, skip
+        # Optional: migrate legacy profiles first (один раз за сессию, не на каждый Load)
+        if not PageGenBasic._migrated_this_session:
+            try:
+                from ...utils.migrate import migrate_legacy_profiles
+                result = migrate_legacy_profiles()
+                PageGenBasic._migrated_this_session = True
+                if result.get("migrated", 0) > 0:
+                    self._status(f"Migrated {result['migrated']} legacy profiles to rfgen/profiles")
+            except ImportError:
+                pass  # migrate module doesn't exist yet, skip
 
         pdir = str(profiles_dir())
         path, _ = QFileDialog.getOpenFileName(self, "Load Profile", pdir, "Profiles (*.json)")
@@ -246,47 +321,94 @@ class PageGenBasic(QWidget):
         """Validate profile structure and values (delegates to utils/profile_io)."""
         return validate_profile(p)
 
+    @contextmanager
+    def _batch(self):
+        """Пакетная запись в виджеты формы: без сигналов и промежуточных перерисовок.
+
+        Уже заблокированные виджеты не трогаем — вложенный _batch их не разблокирует.
+        """
+        widgets = (self.combo_backend, self.fs_tx, self.tx_gain, self.pa_enable,
+                   self.target_hz, self.if_offset_hz, self.freq_corr_hz,
+                   self.combo_mod, self.deviation, self.pm_index, self.am_depth,
+                   self.combo_pat, self.tone_hz, self.bitrate,
+                   self.loop, self.repeat, self.gap_s)
+        was_enabled = self.updatesEnabled()
+        blocked = [w for w in widgets if not w.signalsBlocked()]
+        self.setUpdatesEnabled(False)
+        for w in blocked:
+            w.blockSignals(True)
+        try:
+            yield
+        finally:
+            for w in blocked:
+                w.blockSignals(False)
+            if was_enabled:
+                self.setUpdatesEnabled(True)
+                self.update()
+            # Сигналы были заблокированы — кэш профиля сбрасываем явно
+            self._profile_dirty = True
+
     def _apply_profile_to_form(self, p):
         """Map profile values to UI widgets."""
-        # Device
-        backend = str(p["device"].get("backend", "hackrf"))
-        idx = self.combo_backend.findText(backend)
-        if idx >= 0:
-            self.combo_backend.setCurrentIndex(idx)
-
-        self.fs_tx.setValue(int(p["device"].get("fs_tx", 2_000_000)))
-        self.tx_gain.setValue(int(p["device"].get("tx_gain_db", 30)))
-        self.pa_enable.setChecked(bool(p["device"].get("pa", False)))
-        self.target_hz.setText(str(int(p["device"].get("target_hz", 0))))
-        self.if_offset_hz.setText(str(int(p["device"].get("if_offset_hz", 0))))
-        self.freq_corr_hz.setText(str(int(p["device"].get("freq_corr_hz", 0))))
-
-        # Modulation
-        mod_type = str(p["modulation"].get("type", "None"))
-        idx = self.combo_mod.findText(mod_type)
-        if idx >= 0:
-            self.combo_mod.setCurrentIndex(idx)
-
-        self.deviation.setValue(int(p["modulation"].get("deviation_hz", 5000)))
-        self.pm_index.setValue(float(p["modulation"].get("pm_index", 1.0)))
-        self.am_depth.setValue(float(p["modulation"].get("am_depth", 0.5)))
-
-        # Pattern
-        pat_type = str(p["pattern"].get("type", "Tone"))
-        idx = self.combo_pat.findText(pat_type)
-        if idx >= 0:
-            self.combo_pat.setCurrentIndex(idx)
-
-        self.tone_hz.setValue(int(p["pattern"].get("tone_hz", 1000)))
-        self.bitrate.setValue(int(p["pattern"].get("bitrate_bps", 9600)))
-
-        # Schedule
-        mode = str(p["schedule"].get("mode", "loop")).lower()
-        self.loop.setChecked(mode == "loop")
-        self.repeat.setValue(int(p["schedule"].get("repeat", 1)))
-        self.gap_s.setValue(float(p["schedule"].get("gap_s", 0.0)))
+        with self._batch():
+            # Device
+            backend = str(p["device"].get("backend", "hackrf"))
+            idx = _BACKEND_IDX.get(backend)
+            if idx is not None:
+                self.combo_backend.setCurrentIndex(idx)
+
+            self.fs_tx.setValue(int(p["device"].get("fs_tx", 2_000_000)))
+            self.tx_gain.setValue(int(p["device"].get("tx_gain_db", 30)))
+            self.pa_enable.setChecked(bool(p["device"].get("pa", False)))
+            self.target_hz.setText(str(int(p["device"].get("target_hz", 0))))
+            self.if_offset_hz.setText(str(int(p["device"].get("if_offset_hz", 0))))
+            self.freq_corr_hz.setText(str(int(p["device"].get("freq_corr_hz", 0))))
+
+            # Modulation
+            mod_type = str(p["modulation"].get("type", "None"))
+            idx = _MOD_IDX.get(mod_type)
+            if idx is not None:
+                self.combo_mod.setCurrentIndex(idx)
+
+            self.deviation.setValue(int(p["modulation"].get("deviation_hz", 5000)))
+            self.pm_index.setValue(float(p["modulation"].get("pm_index", 1.0)))
+            self.am_depth.setValue(float(p["modulation"].get("am_depth", 0.5)))
+
+            # Pattern
+            pat_type = str(p["pattern"].get("type", "Tone"))
+            idx = _PAT_IDX.get(pat_type)
+            if idx is not None:
+                self.combo_pat.setCurrentIndex(idx)
+
+            self.tone_hz.setValue(int(p["pattern"].get("tone_hz", 1000)))
+            self.bitrate.setValue(int(p["pattern"].get("bitrate_bps", 9600)))
+
+            # Schedule
+            mode = str(p["schedule"].get("mode", "loop")).lower()
+            self.loop.setChecked(mode == "loop")
+            self.repeat.setValue(int(p["schedule"].get("repeat", 1)))
+            self.gap_s.setValue(float(p["schedule"].get("gap_s", 0.0)))
 
     def _start_tx(self):
+        # Повторный Start (двойной клик), пока кадр строится и пишется, — игнорируем
+        if self._tx_busy:
+            return
+        self._tx_busy = True
+        self.btn_start.setEnabled(False)
+        try:
+            self._do_start_tx()
+        finally:
+            self._tx_busy = False
+            # HackRF не запущен (ошибка или fileout) — Start снова доступен
+            if self._hrf is None:
+                self.btn_start.setEnabled(True)
+
+    def _do_start_tx(self):
+        # numpy/генератор/backend'ы — только при первом Start, не при старте приложения
+        from ...core.wave_engine import build_iq, build_cw
+        from ...backends.fileout import FileOutBackend
+        from ...backends.hackrf import HackRFTx
+
         prof = self._collect_profile()
         backend = prof["device"]["backend"]
         fs = int(prof["device"]["fs_tx"])
@@ -300,14 +422,23 @@ class PageGenBasic(QWidget):
         mode = schedule.get("mode", "loop")
         gap_s = float(schedule.get("gap_s", 0.0))
 
-        # Build IQ (генератор выдаёт чистый baseband на 0 Гц)
-        if self.combo_mod.currentText().lower() == "none":
-            iq = build_cw(prof, frame_s=1.0)
-        else:
-            iq = build_iq(prof, frame_s=1.0)
+        # Кадр зависит только от modulation/pattern/device: при тех же параметрах
+        # (Stop -> Start) берём уже записанный SC8, если файл не трогали
+        iq_key = hashlib.blake2b(
+            json.dumps([prof["modulation"], prof["pattern"], prof["device"]],
+                       sort_keys=True).encode(),
+            digest_size=16).digest()
+        iq_path = self._cached_iq_path(iq_key)
+        if iq_path is None:
+            # Build IQ (генератор выдаёт чистый baseband на 0 Гц)
+            if self.combo_mod.currentText().lower() == "none":
+                iq = build_cw(prof, frame_s=1.0)
+            else:
+                iq = build_iq(prof, frame_s=1.0)
 
-        fob = FileOutBackend(out_dir())
-        iq_path = Path(fob.write_sc8("quick_tx_frame", iq))  # <-- SC8
+            fob = FileOutBackend(out_dir())
+            iq_path = Path(fob.write_sc8("quick_tx_frame", iq))  # <-- SC8
+            self._last_iq = (iq_key, iq_path, iq_path.stat().st_mtime_ns)
 
         if backend == "hackrf":
             self._hrf = HackRFTx()
@@ -339,9 +470,9 @@ class PageGenBasic(QWidget):
             self.btn_stop.setEnabled(True)
 
             # Show log path in status
-            log = getattr(self._hrf, "log_path", None)
-            if log:
-                self._status(f"HackRF TX running (PID {self._hrf.pid}). Log: {log.name}")
+            log_path = getattr(self._hrf, "log_path", None)
+            if log_path:
+                self._status(f"HackRF TX running (PID {self._hrf.pid}). Log: {log_path.name}")
             else:
                 self._status(f"HackRF TX running (PID {self._hrf.pid}).")
         else:
@@ -349,26 +480,40 @@ class PageGenBasic(QWidget):
                                     f"Generated 1s IQ to: {iq_path}\nBackend: fileout.")
             self._status("TX: generated 1s frame (fileout).")
 
+    def _cached_iq_path(self, iq_key):
+        """Путь SC8 последнего кадра, если ключ совпал и файл не менялся, иначе None."""
+        if self._last_iq is None:
+            return None
+        key, path, mtime_ns = self._last_iq
+        if key != iq_key:
+            return None
+        try:
+            if path.stat().st_mtime_ns != mtime_ns:
+                return None
+        except OSError:
+            return None
+        return path
+
     def _stop_tx(self):
-        print("[DEBUG] _stop_tx called")  # DEBUG
+        log.debug("_stop_tx called")
 
         if self._hrf and self._hrf.is_running():
-            print(f"[DEBUG] Process is running, PID: {self._hrf.pid}")  # DEBUG
+            log.debug("Process is running, PID: %s", self._hrf.pid)
             self._hrf.stop()
-            print("[DEBUG] stop() returned")  # DEBUG
+            log.debug("stop() returned")
             self._status("HackRF TX stopped.")
         else:
-            print("[DEBUG] No process to stop")  # DEBUG
+            log.debug("No process to stop")
             self._status("Nothing to stop.")
 
         # Always re-enable buttons after stop
-        print("[DEBUG] Re-enabling buttons")  # DEBUG
+        log.debug("Re-enabling buttons")
         self.btn_start.setEnabled(True)
         self.btn_save.setEnabled(True)
         self.btn_load.setEnabled(True)
         self.btn_stop.setEnabled(False)
         self._hrf = None
-        print("[DEBUG] _stop_tx finished")  # DEBUG
+        log.debug("_stop_tx finished")
 
     def _status(self, msg: str):
         mw = self.window()
@@ -377,7 +522,5 @@ class PageGenBasic(QWidget):
 
     @staticmethod
     def _safe_int(text: str, default: int = 0) -> int:
-        try:
-            return int(str(text).strip())
-        except Exception:
-            return default
+        text = str(text)
+        return int(text) if _INT_RE.fullmatch(text) else default
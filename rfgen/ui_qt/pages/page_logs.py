@@ -1,17 +1,81 @@
 """Logs viewer and system diagnostics page."""
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTextEdit, QLabel, QComboBox, QGroupBox, QMessageBox,
+    QPlainTextEdit, QLabel, QComboBox, QGroupBox, QMessageBox,
     QCheckBox
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QThreadPool, QSignalBlocker
 from pathlib import Path
+from collections import deque
+import functools
+import os
 import sys
 import subprocess
 import shutil
 import platform
+import time
 
 from ...utils.paths import logs_dir, pkg_root
+from ..components.common import BackgroundTask
+
+
+@functools.lru_cache(maxsize=4)
+def _which_cached(name):
+    """shutil.which() с кэшем на время жизни процесса (PATH не обходим повторно)."""
+    return shutil.which(name)
+
+
+def _scan_hackrf_processes():
+    """Список запущенных hackrf_transfer: [(pid, cmd), ...] (tasklist/pgrep)."""
+    processes = []
+    try:
+        if platform.system() == "Windows":
+            result = subprocess.run(
+                ['tasklist', '/FI', 'IMAGENAME eq hackrf_transfer.exe', '/FO', 'CSV', '/NH'],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            for line in result.stdout.strip().split('\n'):
+                if 'hackrf_transfer' in line.lower():
+                    parts = line.replace('"', '').split(',')
+                    if len(parts) >= 2:
+                        processes.append((parts[1].strip(), parts[0].strip()))
+        else:
+            result = subprocess.run(
+                ['pgrep', '-a', 'hackrf_transfer'],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            for line in result.stdout.strip().split('\n'):
+                if line:
+                    parts = line.split(None, 1)
+                    if len(parts) >= 2:
+                        processes.append((parts[0], parts[1]))
+    except Exception:
+        pass
+    return processes
+
+
+def _kill_processes(processes):
+    """Убивает процессы из списка [(pid, cmd), ...]. Возвращает (killed, errors)."""
+    killed = 0
+    errors = []
+
+    for pid, cmd in processes:
+        try:
+            if platform.system() == "Windows":
+                subprocess.run(['taskkill', '/PID', str(pid), '/F', '/T'],
+                             check=True, capture_output=True)
+            else:
+                subprocess.run(['kill', '-9', str(pid)],
+                             check=True, capture_output=True)
+            killed += 1
+        except Exception as e:
+            errors.append(f"PID {pid}: {e}")
+
+    return killed, errors
 
 
 class PageLogs(QWidget):
@@ -74,7 +138,7 @@ class PageLogs(QWidget):
         log_layout.addLayout(file_row)
 
         # Log content viewer
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setPlaceholderText("Select a log file to view...")
         self.log_text.setStyleSheet("font-family: 'Consolas', monospace; font-size: 9pt;")
@@ -89,6 +153,8 @@ class PageLogs(QWidget):
         self.tail_lines = QComboBox()
         self.tail_lines.addItems(["50 lines", "100 lines", "200 lines", "All"])
         self.tail_lines.setCurrentText("100 lines")
+        self.tail_lines.currentTextChanged.connect(self._on_tail_lines_changed)
+        self._apply_tail_limit()
         tail_row.addWidget(QLabel("Show:"))
         tail_row.addWidget(self.tail_lines)
         tail_row.addStretch()
@@ -105,9 +171,9 @@ class PageLogs(QWidget):
         btn_open_folder.clicked.connect(self._open_logs_folder)
         btn_layout.addWidget(btn_open_folder)
 
-        btn_kill_hackrf = QPushButton("Kill All hackrf_transfer")
-        btn_kill_hackrf.clicked.connect(self._kill_hackrf_processes)
-        btn_layout.addWidget(btn_kill_hackrf)
+        self.btn_kill_hackrf = QPushButton("Kill All hackrf_transfer")
+        self.btn_kill_hackrf.clicked.connect(self._kill_hackrf_processes)
+        btn_layout.addWidget(self.btn_kill_hackrf)
 
         btn_clear_logs = QPushButton("Clear Logs...")
         btn_clear_logs.clicked.connect(self._clear_logs)
@@ -122,6 +188,14 @@ class PageLogs(QWidget):
         self.status_label = QLabel("Ready")
         root.addWidget(self.status_label)
 
+        # Позиция (в байтах), до которой лог уже показан: {имя файла: offset}
+        self._tail_offset = {}
+        # (имя файла, размер, mtime_ns) на момент последнего чтения
+        self._last_stat = None
+
+        # (время monotonic, список процессов) последнего опроса tasklist/pgrep
+        self._last_proc_scan = (0.0, [])
+
         # Timer for auto-refresh
         self.tail_timer = QTimer()
         self.tail_timer.timeout.connect(self._refresh_log_content)
@@ -145,8 +219,8 @@ class PageLogs(QWidget):
         lines.append(f"Logs dir: {logs_dir()}")
 
         # HackRF utilities
-        hackrf_info = shutil.which("hackrf_info")
-        hackrf_transfer = shutil.which("hackrf_transfer")
+        hackrf_info = _which_cached("hackrf_info")
+        hackrf_transfer = _which_cached("hackrf_transfer")
 
         if hackrf_info:
             lines.append(f"hackrf_info: {hackrf_info}")
@@ -158,9 +232,39 @@ class PageLogs(QWidget):
         else:
             lines.append("hackrf_transfer: NOT FOUND in PATH")
 
-        # Running hackrf_transfer processes
-        running = self._get_hackrf_processes()
-        if running:
+        # Статическая часть показывается сразу, список процессов — по готовности
+        self._diag_static = lines
+        self.diag_text.setText("\n".join(lines + ["\nScanning hackrf_transfer processes..."]))
+        self._request_proc_scan(self._apply_diag)
+
+    def _request_proc_scan(self, slot):
+        """Передать slot список процессов hackrf_transfer.
+
+        Опрос tasklist/pgrep — в QThreadPool; результат не старше 1 с
+        переиспользуется без нового опроса (slot вызывается сразу).
+        """
+        if time.monotonic() - self._last_proc_scan[0] < 1.0:
+            slot(self._last_proc_scan[1])
+            return
+
+        task = BackgroundTask(_scan_hackrf_processes)
+        # Слоты вызываются в порядке подключения: сначала кэш, затем slot
+        task.signals.finished.connect(self._on_proc_scan_done)
+        task.signals.finished.connect(slot)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_proc_scan_done(self, processes):
+        """Результат фонового опроса процессов — в кэш (сбой не кэшируется)."""
+        if isinstance(processes, Exception):
+            return
+        self._last_proc_scan = (time.monotonic(), processes)
+
+    def _apply_diag(self, running):
+        """Render diagnostics with the running hackrf_transfer processes block."""
+        lines = list(self._diag_static)
+        if isinstance(running, Exception):
+            lines.append(f"\nProcess scan failed: {running}")
+        elif running:
             lines.append(f"\nRunning hackrf_transfer processes: {len(running)}")
             for pid, cmd in running[:5]:  # Show first 5
                 lines.append(f"  PID {pid}: {cmd}")
@@ -172,54 +276,36 @@ class PageLogs(QWidget):
         self.diag_text.setText("\n".join(lines))
         self.status_label.setText("Diagnostics refreshed")
 
-    def _get_hackrf_processes(self):
-        """Get list of running hackrf_transfer processes."""
-        processes = []
-        try:
-            if platform.system() == "Windows":
-                result = subprocess.run(
-                    ['tasklist', '/FI', 'IMAGENAME eq hackrf_transfer.exe', '/FO', 'CSV', '/NH'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                for line in result.stdout.strip().split('\n'):
-                    if 'hackrf_transfer' in line.lower():
-                        parts = line.replace('"', '').split(',')
-                        if len(parts) >= 2:
-                            processes.append((parts[1].strip(), parts[0].strip()))
-            else:
-                result = subprocess.run(
-                    ['pgrep', '-a', 'hackrf_transfer'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split(None, 1)
-                        if len(parts) >= 2:
-                            processes.append((parts[0], parts[1]))
-        except Exception:
-            pass
-        return processes
+    def _invalidate_proc_scan(self):
+        """Сбросить кэш списка процессов (после kill список устарел)."""
+        self._last_proc_scan = (0.0, [])
 
     def _refresh_log_list(self):
         """Refresh list of log files."""
-        self.combo_log.clear()
-
         ldir = logs_dir()
-        log_files = sorted(ldir.glob("*.log"), key=lambda p: p.stat().st_mtime, reverse=True)
-
-        if not log_files:
+        # scandir: mtime берём из DirEntry, без отдельного stat() через Path
+        with os.scandir(ldir) as it:
+            entries = [(e.name, e.stat().st_mtime) for e in it
+                       if e.name.endswith(".log") and e.is_file()]
+        entries.sort(key=lambda x: x[1], reverse=True)
+
+        # Перезаполняем без currentTextChanged на clear()/addItems():
+        # иначе _on_log_changed перечитывал бы лог до N+1 раз
+        blocker = QSignalBlocker(self.combo_log)
+        self.combo_log.clear()
+        if entries:
+            self.combo_log.addItems([name for name, _ in entries])
+        else:
             self.combo_log.addItem("(no logs found)")
+        blocker.unblock()
+        # Одна загрузка содержимого для выбранного файла
+        self._on_log_changed(self.combo_log.currentText())
+
+        if not entries:
             self.status_label.setText("No log files found")
             return
 
-        for log_file in log_files:
-            self.combo_log.addItem(log_file.name)
-
-        self.status_label.setText(f"Found {len(log_files)} log file(s)")
+        self.status_label.setText(f"Found {len(entries)} log file(s)")
 
     def _on_log_changed(self, filename):
         """Load and display selected log file."""
@@ -227,42 +313,124 @@ class PageLogs(QWidget):
             self.log_text.clear()
             return
 
+        # Новый файл — всегда полная загрузка
+        self._tail_offset.pop(filename, None)
         self._refresh_log_content()
 
     def _refresh_log_content(self):
-        """Refresh log content from currently selected file."""
+        """Refresh log content from currently selected file.
+
+        При повторных вызовах (tail mode) дочитывает только байты,
+        добавленные в файл с прошлого раза.
+        """
         filename = self.combo_log.currentText()
         if not filename or filename == "(no logs found)":
             return
 
         log_path = logs_dir() / filename
-        if not log_path.exists():
+        try:
+            st = log_path.stat()
+        except FileNotFoundError:
+            self._tail_offset.pop(filename, None)
+            self._last_stat = None
             self.log_text.setPlainText("(file not found)")
             return
+        except Exception as e:
+            self.log_text.setPlainText(f"Error reading log: {e}")
+            return
+
+        size = st.st_size
+        sig = (filename, size, st.st_mtime_ns)
+        offset = self._tail_offset.get(filename)
+        if offset is not None and sig == self._last_stat:
+            return  # файл не менялся с прошлого тика
+        self._last_stat = sig
+
+        if offset is None or size <= offset:
+            # Первая загрузка, файл усечён/пересоздан или переписан без роста
+            self._reload_log_content(filename, log_path, size)
+            return
 
         try:
-            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
-                lines = f.readlines()
+            with open(log_path, 'rb') as f:
+                f.seek(offset)
+                delta = f.read(size - offset)
+        except Exception as e:
+            self.log_text.setPlainText(f"Error reading log: {e}")
+            return
+
+        # Добавляем только завершённые строки, хвост дочитаем в следующий раз
+        end = delta.rfind(b"\n")
+        if end < 0:
+            return
+        self._tail_offset[filename] = offset + end + 1
+        self.log_text.appendPlainText(delta[:end].decode('utf-8', errors='replace'))
+        self._scroll_log_to_end()
+
+    def _reload_log_content(self, filename, log_path, size):
+        """Полная загрузка лога: последние N строк (или весь файл для "All").
 
-            # Apply tail limit
+        Как и при дозаписи, показываются только завершённые строки: offset
+        ставится сразу за последним \n, незаконченную строку дочитает tail.
+        """
+        try:
             tail_text = self.tail_lines.currentText()
-            if tail_text == "All":
-                content = "".join(lines)
+            with open(log_path, 'rb') as f:
+                # Весь файл для "All", иначе последние N строк — только в хвостовом окне
+                start = 0 if tail_text == "All" else max(0, size - 64 * 1024)
+                f.seek(start)
+                data = f.read(size - start)
+            end = data.rfind(b"\n")
+            if end < 0:
+                lines = []
             else:
-                limit = int(tail_text.split()[0])
-                content = "".join(lines[-limit:])
+                lines = data[:end].decode('utf-8', errors='replace').split("\n")
+                if start > 0:
+                    lines = lines[1:]  # первая строка окна обрезана
+            if tail_text != "All":
+                lines = deque(lines, maxlen=int(tail_text.split()[0]))
+            content = "\n".join(lines)
 
             self.log_text.setPlainText(content)
-
-            # Auto-scroll to bottom
-            if self.chk_tail.isChecked():
-                cursor = self.log_text.textCursor()
-                cursor.movePosition(cursor.End)
-                self.log_text.setTextCursor(cursor)
+            self._tail_offset[filename] = start + end + 1
+            self._scroll_log_to_end()
 
         except Exception as e:
             self.log_text.setPlainText(f"Error reading log: {e}")
 
+    def _apply_tail_limit(self):
+        """Ограничить число строк в документе выбранным "Show: N lines".
+
+        При дозаписи через appendPlainText() старые строки уходят сверху
+        автоматически, размер документа не растёт. "All" — без ограничения.
+        """
+        tail_text = self.tail_lines.currentText()
+        limit = 0 if tail_text == "All" else int(tail_text.split()[0])
+        self.log_text.document().setMaximumBlockCount(limit)
+
+    def _on_tail_lines_changed(self, _text):
+        """Новый лимит строк: применить и перечитать текущий лог."""
+        self._apply_tail_limit()
+        self._tail_offset.pop(self.combo_log.currentText(), None)
+        self._refresh_log_content()
+
+    def _scroll_log_to_end(self):
+        """Auto-scroll to bottom in tail mode."""
+        if self.chk_tail.isChecked():
+            cursor = self.log_text.textCursor()
+            cursor.movePosition(cursor.End)
+            self.log_text.setTextCursor(cursor)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.chk_tail.isChecked():
+            self.tail_timer.start()
+
+    def hideEvent(self, event):
+        # Страница не видна — не опрашиваем файл впустую
+        self.tail_timer.stop()
+        super().hideEvent(event)
+
     def _toggle_tail(self, enabled):
         """Enable/disable tail mode."""
         if enabled:
@@ -288,9 +456,19 @@ class PageLogs(QWidget):
 
     def _kill_hackrf_processes(self):
         """Kill all running hackrf_transfer processes."""
-        processes = self._get_hackrf_processes()
-
+        # tasklist/pgrep — в QThreadPool, подтверждение и kill — в _on_kill_scan_done
+        self.btn_kill_hackrf.setEnabled(False)
+        self.status_label.setText("Scanning hackrf_transfer processes...")
+        self._request_proc_scan(self._on_kill_scan_done)
+
+    def _on_kill_scan_done(self, processes):
+        """Список процессов получен в фоне: подтвердить и запустить kill."""
+        if isinstance(processes, Exception):
+            self.btn_kill_hackrf.setEnabled(True)
+            QMessageBox.warning(self, "Kill Processes", f"Failed to list processes:\n{processes}")
+            return
         if not processes:
+            self.btn_kill_hackrf.setEnabled(True)
             QMessageBox.information(self, "Kill Processes", "No hackrf_transfer processes running")
             return
 
@@ -303,28 +481,31 @@ class PageLogs(QWidget):
         )
 
         if reply != QMessageBox.Yes:
+            self.btn_kill_hackrf.setEnabled(True)
             return
 
-        killed = 0
-        errors = []
-
-        for pid, cmd in processes:
-            try:
-                if platform.system() == "Windows":
-                    subprocess.run(['taskkill', '/PID', str(pid), '/F', '/T'],
-                                 check=True, capture_output=True)
-                else:
-                    subprocess.run(['kill', '-9', str(pid)],
-                                 check=True, capture_output=True)
-                killed += 1
-            except Exception as e:
-                errors.append(f"PID {pid}: {e}")
+        # taskkill/kill для многих PID выполняем в фоне
+        self.status_label.setText(f"Killing {len(processes)} process(es)...")
+        task = BackgroundTask(_kill_processes, processes)
+        task.signals.finished.connect(self._on_kill_done)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_kill_done(self, result):
+        """Результат фонового kill."""
+        self.btn_kill_hackrf.setEnabled(True)
+        if isinstance(result, Exception):
+            QMessageBox.warning(self, "Kill Processes", f"Failed to kill processes:\n{result}")
+            self._invalidate_proc_scan()
+            self._refresh_diagnostics()
+            return
+        killed, errors = result
 
         msg = f"Killed {killed} process(es)"
         if errors:
             msg += f"\n\nErrors:\n" + "\n".join(errors[:5])
 
         QMessageBox.information(self, "Kill Processes", msg)
+        self._invalidate_proc_scan()
         self._refresh_diagnostics()
 
     def _clear_logs(self):
@@ -4,12 +4,83 @@ from PySide6.QtWidgets import (
     QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox, QGroupBox, QLabel, QTextEdit, QFileDialog, QCheckBox,
     QMessageBox, QRadioButton, QButtonGroup, QScrollArea
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker, QThreadPool, QTimer
 from pathlib import Path
-import datetime
+import functools
+import os
+import time
 
 from ...utils.paths import profiles_dir
-from ...utils.profile_io import validate_profile, apply_defaults, load_json, save_json
+from ...utils.profile_io import validate_profile, load_json, save_json
+from ..components.common import BackgroundTask
+
+# Элементы комбобоксов и обратные индексы text -> index
+_BACKENDS = ("hackrf", "fileout")
+# Пункт combo_freq -> target_hz (Гц); элементы комбобокса берутся из ключей
+_FREQ_MAP = {
+    "518 kHz (International)": 518_000,
+    "490 kHz (National)": 490_000,
+    "4209.5 kHz (HF)": 4_209_500,
+}
+_FREQUENCIES = tuple(_FREQ_MAP)
+_BACKEND_IDX = {t: i for i, t in enumerate(_BACKENDS)}
+_FREQ_IDX = {t: i for i, t in enumerate(_FREQUENCIES)}
+
+# Предел размера файла для Import from File (NAVTEX-сообщения < 10 КБ)
+_IMPORT_MAX_BYTES = 1 << 20
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_validated_profile(path_str, mtime_ns, size):
+    """load_json + validate_profile, кэш по (путь, mtime, размер).
+
+    Изменение файла меняет ключ, поэтому отдельная инвалидация не нужна.
+    Возвращает (data, ok, msg); data — общий объект, не изменять.
+    """
+    data = load_json(Path(path_str))
+    if not data:
+        return None, False, "Can't read profile"
+    ok, msg = validate_profile(data)
+    return data, ok, msg
+
+
+def _load_validated_profile(path: Path):
+    """Кэшированная загрузка профиля; (None, False, msg) если файла нет."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None, False, "Can't read profile"
+    return _cached_validated_profile(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _to_cf32(iq):
+    """IQ -> interleaved float32 (I,Q,I,Q...) за один проход.
+
+    complex64 в памяти уже лежит как I,Q: для C-contiguous complex64 это view
+    без копирования, иначе одно непрерывное приведение типа.
+    """
+    import numpy as np
+    return np.ascontiguousarray(iq, dtype=np.complex64).view(np.float32)
+
+
+def _write_raw(path, buf):
+    """Записать буфер (ndarray/bytes) в файл через os.write без промежуточных копий."""
+    mv = memoryview(buf).cast("B")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while mv:
+            mv = mv[os.write(fd, mv):]
+    finally:
+        os.close(fd)
+
+
+def _build_iq_task(prof):
+    """Фоновая задача: build_iq. Возвращает (prof, iq).
+
+    Сбой (в т.ч. импорта wave_engine) BackgroundTask передаёт в слот объектом исключения.
+    """
+    from ...core.wave_engine import build_iq
+    return prof, build_iq(prof, frame_s=1.0)
 
 
 class PageNAVTEX(QWidget):
@@ -23,9 +94,66 @@ class PageNAVTEX(QWidget):
     - Station ID and message type
     """
 
+    # Статические части формы: (атрибут, подпись, класс виджета, вызовы настройки).
+    # Описание разбирается один раз при импорте; _build_form лишь создаёт виджеты.
+    _DEVICE_FORM = (
+        ("combo_backend", "Backend", QComboBox, (
+            ("addItems", (_BACKENDS,)),
+        )),
+        ("fs_tx", "Fs TX (S/s)", QSpinBox, (
+            ("setRange", (200_000, 20_000_000)),
+            ("setSingleStep", (100_000,)),
+            ("setValue", (2_000_000,)),
+        )),
+        ("tx_gain_device", "TX Gain (dB)", QSpinBox, (
+            ("setRange", (0, 60)),
+            ("setValue", (30,)),
+        )),
+        ("pa_enable", "", QCheckBox, (
+            ("setText", ("Enable PA",)),
+        )),
+    )
+    # Частоты — спинбоксы: целое проверяется при вводе, а не при сборе профиля.
+    # Target — QDoubleSpinBox без дробной части: диапазон validate_profile
+    # (до 7.25 ГГц) не помещается в int32 QSpinBox
+    _RADIO_FORM = (
+        # 518 kHz - International NAVTEX
+        ("target_hz_radio", "Target (Hz)", QDoubleSpinBox, (
+            ("setDecimals", (0,)),
+            ("setRange", (0, 7_250_000_000)),
+            ("setSingleStep", (1_000,)),
+            ("setValue", (518_000,)),
+        )),
+        ("if_offset_hz", "IF offset (Hz)", QSpinBox, (
+            ("setRange", (-1_000_000_000, 1_000_000_000)),
+            ("setValue", (0,)),
+        )),
+        ("freq_corr_hz", "Freq corr (Hz)", QSpinBox, (
+            ("setRange", (-1_000_000, 1_000_000)),
+            ("setValue", (0,)),
+        )),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Виджеты строятся при первом показе страницы (showEvent):
+        # до перехода на NAVTEX страница не создаёт ни формы, ни профиля
+        self._ui_built = False
+
+        # Backend instance
+        self._hackrf_backend = None
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._ui_built:
+            self._build_ui()
+            self._ui_built = True
+            # Auto-load default profile if exists (после первой отрисовки формы)
+            QTimer.singleShot(0, self._load_default_profile)
+
+    def _build_ui(self):
+        """Построение формы страницы (однократно, из showEvent)."""
         # Главный layout для всей страницы
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -48,46 +176,18 @@ class PageNAVTEX(QWidget):
         header.setStyleSheet("font-size: 14pt;")
         root.addWidget(header)
 
-        # Device group
-        dev_group = QGroupBox("Device")
-        dev_form = QFormLayout(dev_group)
-        self.combo_backend = QComboBox()
-        self.combo_backend.addItems(["hackrf", "fileout"])
-        self.fs_tx = QSpinBox()
-        self.fs_tx.setRange(200_000, 20_000_000)
-        self.fs_tx.setSingleStep(100_000)
-        self.fs_tx.setValue(2_000_000)
-        self.tx_gain_device = QSpinBox()
-        self.tx_gain_device.setRange(0, 60)
-        self.tx_gain_device.setValue(30)
-        self.pa_enable = QCheckBox("Enable PA")
-        dev_form.addRow("Backend", self.combo_backend)
-        dev_form.addRow("Fs TX (S/s)", self.fs_tx)
-        dev_form.addRow("TX Gain (dB)", self.tx_gain_device)
-        dev_form.addRow("", self.pa_enable)
-        root.addWidget(dev_group)
-
-        # Radio group
-        rf_group = QGroupBox("Radio")
-        rf_form = QFormLayout(rf_group)
-        self.target_hz_radio = QLineEdit("518000")  # 518 kHz - International NAVTEX
-        self.if_offset_hz = QLineEdit("0")
-        self.freq_corr_hz = QLineEdit("0")
-        rf_form.addRow("Target (Hz)", self.target_hz_radio)
-        rf_form.addRow("IF offset (Hz)", self.if_offset_hz)
-        rf_form.addRow("Freq corr (Hz)", self.freq_corr_hz)
-        root.addWidget(rf_group)
+        # Device / Radio groups — из спецификации класса
+        for title, spec in (("Device", self._DEVICE_FORM), ("Radio", self._RADIO_FORM)):
+            group = QGroupBox(title)
+            self._build_form(QFormLayout(group), spec)
+            root.addWidget(group)
 
         # Frequency selection
         freq_group = QGroupBox("Frequency")
         freq_layout = QFormLayout()
 
         self.combo_freq = QComboBox()
-        self.combo_freq.addItems([
-            "518 kHz (International)",
-            "490 kHz (National)",
-            "4209.5 kHz (HF)"
-        ])
+        self.combo_freq.addItems(_FREQUENCIES)
         freq_layout.addRow("Frequency:", self.combo_freq)
 
         self.combo_freq.currentTextChanged.connect(self._on_freq_changed)
@@ -156,8 +256,8 @@ class PageNAVTEX(QWidget):
         root.addWidget(msg_group)
 
         # Connect mode change signal
-        self.radio_hex.toggled.connect(self._on_mode_changed)
-        self.radio_builder.toggled.connect(self._on_mode_changed)
+        # buttonClicked — один вызов на клик (toggled приходил от обеих кнопок)
+        self.mode_group.buttonClicked.connect(lambda _btn: self._on_mode_changed())
         self._on_mode_changed()  # Set initial field states
 
         # TX settings
@@ -204,8 +304,7 @@ class PageNAVTEX(QWidget):
         root.addWidget(tx_group)
 
         # Connect TX mode switch
-        self.radio_loop.toggled.connect(self._on_tx_mode_changed)
-        self.radio_finite.toggled.connect(self._on_tx_mode_changed)
+        self.tx_mode_group.buttonClicked.connect(lambda _btn: self._on_tx_mode_changed())
         self._on_tx_mode_changed()  # Set initial TX field states
 
         # Buttons
@@ -238,11 +337,31 @@ class PageNAVTEX(QWidget):
         scroll.setWidget(content)
         main_layout.addWidget(scroll)
 
-        # Backend instance
-        self._hackrf_backend = None
-
-        # Auto-load default profile if exists
-        self._load_default_profile()
+        # Кэш профиля: пересобирается только после изменения виджетов
+        self._profile_cache = None
+        self._profile_dirty = True
+        for combo in (self.combo_backend, self.combo_freq):
+            combo.currentIndexChanged.connect(self._mark_profile_dirty)
+        for spin in (self.fs_tx, self.tx_gain_device, self.target_hz_radio, self.if_offset_hz,
+                     self.freq_corr_hz, self.frame_count, self.gap_s):
+            spin.valueChanged.connect(self._mark_profile_dirty)
+        for edit in (self.hex_message, self.station_id, self.msg_type, self.msg_number,
+                     self.message_text):
+            edit.textChanged.connect(self._mark_profile_dirty)
+        for chk in (self.pa_enable, self.radio_hex, self.radio_loop):
+            chk.toggled.connect(self._mark_profile_dirty)
+
+    def _mark_profile_dirty(self, *_):
+        self._profile_dirty = True
+
+    def _build_form(self, form, spec):
+        """Создать виджеты по спецификации и добавить строки в QFormLayout."""
+        for attr, label, widget_cls, setup in spec:
+            widget = widget_cls()
+            for method, args in setup:
+                getattr(widget, method)(*args)
+            setattr(self, attr, widget)
+            form.addRow(label, widget)
 
     def _on_mode_changed(self):
         """Handle mode switching between Direct HEX and Message Builder."""
@@ -250,11 +369,20 @@ class PageNAVTEX(QWidget):
 
         # Direct HEX mode: enable hex_message, disable builder fields
         # Message Builder mode: disable hex_message, enable builder fields
-        self.hex_message.setEnabled(is_hex_mode)
-        self.station_id.setEnabled(not is_hex_mode)
-        self.msg_type.setEnabled(not is_hex_mode)
-        self.msg_number.setEnabled(not is_hex_mode)
-        self.message_text.setEnabled(not is_hex_mode)
+        # Пять setEnabled — одна перерисовка в конце (если обновления уже
+        # выключены вызывающим, например _apply_profile_to_form, — не включаем)
+        updates = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self.hex_message.setEnabled(is_hex_mode)
+            self.station_id.setEnabled(not is_hex_mode)
+            self.msg_type.setEnabled(not is_hex_mode)
+            self.msg_number.setEnabled(not is_hex_mode)
+            self.message_text.setEnabled(not is_hex_mode)
+        finally:
+            if updates:
+                self.setUpdatesEnabled(True)
+                self.update()
 
     def _on_tx_mode_changed(self):
         """Handle TX mode switching between Loop and Finite."""
@@ -265,25 +393,20 @@ class PageNAVTEX(QWidget):
     def _load_default_profile(self):
         """Auto-load default_navtex.json profile if it exists on startup."""
         default_path = profiles_dir() / "default_navtex.json"
-        if default_path.exists():
-            data = load_json(default_path)
-            if data:
-                # Verify it's the correct standard (safety check)
-                if data.get("standard") != "navtex":
-                    return  # Wrong standard, skip loading
-                ok, msg = validate_profile(data)
-                if ok:
-                    self._apply_profile_to_form(data)
-                    # Silently load - no status message on startup
+        data, ok, msg = _load_validated_profile(default_path)
+        if data:
+            # Verify it's the correct standard (safety check)
+            if data.get("standard") != "navtex":
+                return  # Wrong standard, skip loading
+            if ok:
+                self._apply_profile_to_form(data)
+                # Silently load - no status message on startup
 
     def _on_freq_changed(self, text):
         """Update frequency based on selection."""
-        if "518 kHz" in text:
-            self.target_hz_radio.setText("518000")
-        elif "490 kHz" in text:
-            self.target_hz_radio.setText("490000")
-        elif "4209.5 kHz" in text:
-            self.target_hz_radio.setText("4209500")
+        hz = _FREQ_MAP.get(text)
+        if hz:
+            self.target_hz_radio.setValue(hz)
 
     def _import_text(self):
         """Import message text from file (placeholder)."""
@@ -295,10 +418,17 @@ class PageNAVTEX(QWidget):
         )
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    text = f.read()
-                    self.message_text.setPlainText(text)
-                    self.status_label.setText(f"Imported: {file_path}")
+                # NAVTEX-сообщение — единицы КБ; случайно выбранный большой файл
+                # не читаем целиком в QTextEdit
+                if os.path.getsize(file_path) > _IMPORT_MAX_BYTES:
+                    QMessageBox.warning(
+                        self, "Import",
+                        f"File is too large for a NAVTEX message (> {_IMPORT_MAX_BYTES // 1024} KiB)")
+                    return
+                # Один проход декодирования; \r\n приводим к \n, как делал текстовый режим
+                text = Path(file_path).read_bytes().decode('utf-8', errors='replace')
+                self.message_text.setPlainText(text.replace('\r\n', '\n'))
+                self.status_label.setText(f"Imported: {file_path}")
             except Exception as e:
                 self.status_label.setText(f"Import failed: {e}")
 
@@ -322,17 +452,23 @@ class PageNAVTEX(QWidget):
 
     def _start_fileout(self, prof):
         """Generate and save NAVTEX signal to file."""
-        from ...core.wave_engine import build_iq
+        # build_iq — в QThreadPool, диалог сохранения — в _on_fileout_built
+        self.status_label.setText("Generating NAVTEX signal...")
+        self.btn_start.setEnabled(False)
+        task = BackgroundTask(_build_iq_task, prof)
+        task.signals.finished.connect(self._on_fileout_built)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_fileout_built(self, result):
+        """IQ построен в фоне: спросить путь и сохранить cf32."""
         from ...utils.paths import out_dir
         from ...utils.cf32_naming import generate_cf32_name
-        import numpy as np
 
+        self.btn_start.setEnabled(True)
         try:
-            # Generate IQ
-            self.status_label.setText("Generating NAVTEX signal...")
-            self.update()
-
-            iq = build_iq(prof, frame_s=1.0)
+            if isinstance(result, Exception):
+                raise result
+            prof, iq = result
 
             # Generate default filename with Fs (convention: iq_<FSk>_navtex.cf32)
             fs_tx = prof["device"]["fs_tx"]
@@ -348,11 +484,7 @@ class PageNAVTEX(QWidget):
                 return
 
             # Write interleaved float32 I,Q
-            inter = np.empty(iq.size * 2, dtype=np.float32)
-            inter[0::2] = iq.real.astype(np.float32, copy=False)
-            inter[1::2] = iq.imag.astype(np.float32, copy=False)
-            with open(file_path, "wb") as f:
-                inter.tofile(f)
+            _write_raw(file_path, _to_cf32(iq))
 
             self.status_label.setText(f"Saved: {Path(file_path).name}")
             QMessageBox.information(self, "Success", f"IQ file saved to:\n{file_path}")
@@ -362,48 +494,37 @@ class PageNAVTEX(QWidget):
 
     def _start_hackrf(self, prof):
         """Generate and transmit NAVTEX via HackRF."""
-        from ...core.wave_engine import build_iq
+        # build_iq — в QThreadPool, запуск — в _on_hackrf_built
+        self.status_label.setText("Generating NAVTEX signal...")
+        self.btn_start.setEnabled(False)
+        task = BackgroundTask(_build_iq_task, prof)
+        task.signals.finished.connect(self._on_hackrf_built)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_hackrf_built(self, result):
+        """IQ построен в фоне: запустить hackrf_transfer."""
         from ...backends.hackrf import HackRFTx
-        from ...utils.paths import out_dir, logs_dir
+        from ...utils.paths import out_dir
         from ...utils.cf32_naming import generate_cf32_name
-        import numpy as np
 
         try:
-            # Generate IQ
-            self.status_label.setText("Generating NAVTEX signal...")
-            self.update()
+            if isinstance(result, Exception):
+                raise result
+            prof, iq_tx = result
 
-            # 1. Generate baseband IQ
-            iq_baseband = build_iq(prof, frame_s=1.0)
-
-            # 2. Resample if needed (from baseband to TX sample rate)
+            # NEW: No concatenation! Backend adds gap automatically.
+            # IF shift and freq correction are applied by HackRF backend
             fs_tx = prof["device"]["fs_tx"]
-            iq_tx = iq_baseband
-
-            # 3. Apply IF shift and freq correction (handled by HackRF backend)
-            # Backend will apply digital shift automatically
-
-            # 4. Handle schedule mode
+            # Имя temp-файла: backend кладёт рядом temp sc8 (cf32 не пишется)
+            temp_filename = generate_cf32_name(fs_tx, "temp_navtex", add_timestamp=False)
+            temp_path = out_dir() / temp_filename
             schedule = prof.get("schedule", {})
             mode = schedule.get("mode", "loop")
             gap_s = float(schedule.get("gap_s", 8.0))
 
-            # NEW: No concatenation! Backend adds gap automatically.
-
-            # 5. Save to temporary file
-            temp_filename = generate_cf32_name(fs_tx, "temp_navtex", add_timestamp=False)
-            temp_path = out_dir() / temp_filename
-
-            # Write interleaved float32 I,Q
-            inter = np.empty(iq_tx.size * 2, dtype=np.float32)
-            inter[0::2] = iq_tx.real.astype(np.float32, copy=False)
-            inter[1::2] = iq_tx.imag.astype(np.float32, copy=False)
-            with open(temp_path, "wb") as f:
-                inter.tofile(f)
-
-            # 6. Start HackRF
+            # Start HackRF
             self.status_label.setText("Starting HackRF transmission...")
-            self.update()
+            self.status_label.repaint()
 
             # Get device parameters
             target_hz = prof["device"]["target_hz"]
@@ -426,7 +547,8 @@ class PageNAVTEX(QWidget):
                 if_offset_hz=if_offset_hz,
                 freq_corr_hz=freq_corr_hz,
                 mode=tx_mode,
-                gap_s=gap_s  # Backend adds gap
+                gap_s=gap_s,  # Backend adds gap
+                iq=iq_tx,  # кадр из памяти, без temp cf32
             )
 
             # Update UI
@@ -441,6 +563,7 @@ class PageNAVTEX(QWidget):
             )
 
         except Exception as e:
+            self.btn_start.setEnabled(True)
             QMessageBox.critical(self, "Transmission Failed", str(e))
             self.status_label.setText(f"Error: {e}")
 
@@ -449,7 +572,7 @@ class PageNAVTEX(QWidget):
         if hasattr(self, '_hackrf_backend') and self._hackrf_backend:
             try:
                 self.status_label.setText("Stopping HackRF...")
-                self.update()
+                self.status_label.repaint()
 
                 self._hackrf_backend.stop()
 
@@ -466,7 +589,13 @@ class PageNAVTEX(QWidget):
         self.btn_load.setEnabled(True)
 
     def _collect_profile(self):
-        """Collect current settings into profile dictionary."""
+        """Collect current settings into profile dictionary.
+
+        Кэшируется до следующего изменения формы; dict общий — перед изменением копировать.
+        """
+        if not self._profile_dirty and self._profile_cache is not None:
+            return self._profile_cache
+
         profile = {
             "name": None,
             "standard": "navtex",
@@ -495,19 +624,18 @@ class PageNAVTEX(QWidget):
                 "fs_tx": int(self.fs_tx.value()),
                 "tx_gain_db": int(self.tx_gain_device.value()),
                 "pa": bool(self.pa_enable.isChecked()),
-                "target_hz": int(self._safe_int(self.target_hz_radio.text(), 518000)),
-                "if_offset_hz": int(self._safe_int(self.if_offset_hz.text(), 0)),
-                "freq_corr_hz": int(self._safe_int(self.freq_corr_hz.text(), 0)),
+                "target_hz": int(self.target_hz_radio.value()),
+                "if_offset_hz": int(self.if_offset_hz.value()),
+                "freq_corr_hz": int(self.freq_corr_hz.value()),
             },
-            "_meta": {
-                "created_utc": datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z"
-            }
         }
+        self._profile_cache = profile
+        self._profile_dirty = False
         return profile
 
     def _save_profile(self):
         """Save current settings as profile."""
-        prof = self._collect_profile()
+        prof = dict(self._collect_profile())  # копия: ниже меняем "name" и "_meta"
 
         default_path = str(profiles_dir() / "profile.json")
         file_path, _ = QFileDialog.getSaveFileName(
@@ -525,6 +653,10 @@ class PageNAVTEX(QWidget):
 
         out_path = Path(file_path)
         prof["name"] = out_path.stem
+        # Метка времени только при сохранении: в кэше профиля её нет
+        prof["_meta"] = {
+            "created_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        }
 
         if not save_json(out_path, prof):
             QMessageBox.critical(self, "Save failed", "Can't save profile")
@@ -538,75 +670,104 @@ class PageNAVTEX(QWidget):
         if not path:
             return
 
-        data = load_json(Path(path))
+        data, ok, msg = _load_validated_profile(Path(path))
         if not data:
             QMessageBox.critical(self, "Load failed", "Can't read profile")
             return
 
-        ok, msg = validate_profile(data)
         if not ok:
             QMessageBox.critical(self, "Invalid profile", msg)
             return
 
-        self._apply_profile_to_form(data)
-        self.status_label.setText(f"Profile loaded: {Path(path).name}")
-
-    def _apply_profile_to_form(self, p):
-        """Map profile values to UI widgets."""
-        # Device
-        backend = str(p.get("device", {}).get("backend", "hackrf"))
-        idx = self.combo_backend.findText(backend)
-        if idx >= 0:
-            self.combo_backend.setCurrentIndex(idx)
-
-        self.fs_tx.setValue(int(p.get("device", {}).get("fs_tx", 2_000_000)))
-        self.tx_gain_device.setValue(int(p.get("device", {}).get("tx_gain_db", 30)))
-        self.pa_enable.setChecked(bool(p.get("device", {}).get("pa", False)))
-        self.target_hz_radio.setText(str(int(p.get("device", {}).get("target_hz", 518000))))
-        self.if_offset_hz.setText(str(int(p.get("device", {}).get("if_offset_hz", 0))))
-        self.freq_corr_hz.setText(str(int(p.get("device", {}).get("freq_corr_hz", 0))))
-
-        # Standard params
-        sp = p.get("standard_params", {})
-
-        # Frequency
-        frequency = str(sp.get("frequency", "518 kHz (International)"))
-        idx = self.combo_freq.findText(frequency)
-        if idx >= 0:
-            self.combo_freq.setCurrentIndex(idx)
-
-        # Station and message info
-        self.station_id.setText(str(sp.get("station_id", "A")))
-        self.msg_type.setText(str(sp.get("msg_type", "A")))
-        self.msg_number.setText(str(sp.get("msg_number", "01")))
-        self.message_text.setPlainText(str(sp.get("message_text", "")))
-
-        # HEX message
-        self.hex_message.setText(str(sp.get("hex_message", "")))
-
-        # Input mode (hex or builder)
-        input_mode = str(sp.get("input_mode", "hex"))
-        if input_mode == "hex":
-            self.radio_hex.setChecked(True)
-        else:
-            self.radio_builder.setChecked(True)
-        # Mode change will be handled by _on_mode_changed() signal
-
-        # Schedule
-        schedule = p.get("schedule", {})
-        mode = str(schedule.get("mode", "loop"))
-        if mode == "loop":
-            self.radio_loop.setChecked(True)
+        clamped = self._apply_profile_to_form(data)
+        if clamped:
+            self.status_label.setText(f"Profile loaded: {Path(path).name} "
+                                      f"(out of range, clamped: {', '.join(clamped)})")
         else:
-            self.radio_finite.setChecked(True)
-        # TX mode change will be handled by _on_tx_mode_changed() signal
+            self.status_label.setText(f"Profile loaded: {Path(path).name}")
 
-        self.frame_count.setValue(int(schedule.get("repeat", 5)))
-        self.gap_s.setValue(float(schedule.get("gap_s", 8.0)))
-
-    @staticmethod
-    def _safe_int(text: str, default: int = 0) -> int:
+    def _apply_profile_to_form(self, p):
+        """Map profile values to UI widgets.
+
+        Returns:
+            Ключи device, значения которых не поместились в поля формы и были ограничены.
+        """
+        clamped = []
+        # Блоки профиля — один раз; "or {}" покрывает и null в JSON
+        dev = p.get("device") or {}
+        sp = p.get("standard_params") or {}
+        sch = p.get("schedule") or {}
+
+        # Слоты режимов и частоты заблокированы на время заполнения формы
+        # и вызываются один раз в конце; combo_freq не перетирает target_hz
+        # значением по умолчанию для выбранной частоты
+        # Вся форма — одна перерисовка в конце
+        self.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(w) for w in (
+            self.combo_freq, self.radio_hex, self.radio_builder,
+            self.radio_loop, self.radio_finite,
+        )]
         try:
-            return int(str(text).strip())
-        except Exception:
-            return default
+            # Device
+            backend = str(dev.get("backend", "hackrf"))
+            idx = _BACKEND_IDX.get(backend, -1)
+            if idx >= 0:
+                self.combo_backend.setCurrentIndex(idx)
+
+            self.fs_tx.setValue(int(dev.get("fs_tx", 2_000_000)))
+            self.tx_gain_device.setValue(int(dev.get("tx_gain_db", 30)))
+            self.pa_enable.setChecked(bool(dev.get("pa", False)))
+            # Вне диапазона поля — не молча: значение ограничивается, поле
+            # попадает в список для предупреждения (и без OverflowError у QSpinBox)
+            for spin, key, default in ((self.target_hz_radio, "target_hz", 518000),
+                                       (self.if_offset_hz, "if_offset_hz", 0),
+                                       (self.freq_corr_hz, "freq_corr_hz", 0)):
+                value = int(dev.get(key, default))
+                if not (spin.minimum() <= value <= spin.maximum()):
+                    clamped.append(key)
+                    value = min(max(value, spin.minimum()), spin.maximum())
+                spin.setValue(value)
+
+            # Frequency
+            frequency = str(sp.get("frequency", "518 kHz (International)"))
+            idx = _FREQ_IDX.get(frequency, -1)
+            if idx >= 0:
+                self.combo_freq.setCurrentIndex(idx)
+
+            # Station and message info
+            self.station_id.setText(str(sp.get("station_id", "A")))
+            self.msg_type.setText(str(sp.get("msg_type", "A")))
+            self.msg_number.setText(str(sp.get("msg_number", "01")))
+            self.message_text.setPlainText(str(sp.get("message_text", "")))
+
+            # HEX message
+            self.hex_message.setText(str(sp.get("hex_message", "")))
+
+            # Input mode (hex or builder)
+            input_mode = str(sp.get("input_mode", "hex"))
+            if input_mode == "hex":
+                self.radio_hex.setChecked(True)
+            else:
+                self.radio_builder.setChecked(True)
+
+            # Schedule
+            mode = str(sch.get("mode", "loop"))
+            if mode == "loop":
+                self.radio_loop.setChecked(True)
+            else:
+                self.radio_finite.setChecked(True)
+
+            self.frame_count.setValue(int(sch.get("repeat", 5)))
+            self.gap_s.setValue(float(sch.get("gap_s", 8.0)))
+
+            # Слоты режимов — один раз, по итоговому состоянию радиокнопок
+            self._on_mode_changed()
+            self._on_tx_mode_changed()
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            # Сигналы combo_freq/радиокнопок были заблокированы — кэш сбрасываем явно
+            self._profile_dirty = True
+            self.setUpdatesEnabled(True)
+            self.update()
+        return clamped
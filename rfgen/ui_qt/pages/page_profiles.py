@@ -1,16 +1,158 @@
 """Profile manager page - view, edit, import/export profiles."""
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QListWidget, QListWidgetItem, QTextEdit, QLabel,
+    QListView, QPlainTextEdit, QLabel,
     QMessageBox, QInputDialog, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex, QRunnable, QTimer, QThreadPool
 from pathlib import Path
+import copy
+import errno
+import functools
+import os
 import shutil
 
 from ...utils.paths import profiles_dir
-from ...utils.profile_io import load_json, save_json, validate_profile
-from ...utils.migrate import migrate_legacy_profiles
+from ...utils.profile_io import load_json, save_json, validate_profile, dumps_pretty
+from ..components.common import BackgroundTask
+
+# Превью не длиннее этого (символов): раскладка текста — в GUI-потоке
+_PREVIEW_MAX_CHARS = 200_000
+
+
+@functools.lru_cache(maxsize=64)
+def _load_and_prepare(path_str, mtime_ns, size):
+    """load_json + JSON для превью + validate_profile, кэш по (путь, mtime, размер).
+
+    Returns:
+        (data, pretty, ok, msg); data is None, если файл не прочитан,
+        pretty обрезан до _PREVIEW_MAX_CHARS.
+        data общий для всех вызовов — не изменять.
+    """
+    data = load_json(Path(path_str))
+    if not data:
+        return None, None, False, "Error loading profile"
+    pretty = dumps_pretty(data)
+    if len(pretty) > _PREVIEW_MAX_CHARS:
+        pretty = (pretty[:_PREVIEW_MAX_CHARS]
+                  + f"\n… (truncated, {len(pretty)} chars total)")
+    ok, msg = validate_profile(data)
+    return data, pretty, ok, msg
+
+
+def _load_prepared(path: Path):
+    """_load_and_prepare по текущему stat() файла."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None, None, False, "Error loading profile"
+    return _load_and_prepare(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _preview_task(path: Path):
+    """Фоновая задача превью: (path, результат _load_prepared) или (path, исключение).
+
+    path возвращается и при сбое: по нему слот отбрасывает устаревший результат.
+    """
+    try:
+        return path, _load_prepared(path)
+    except Exception as e:
+        return path, e
+
+
+def _copy_file(src, dst, exclusive=False):
+    """Копировать содержимое src в dst блоками по 1 MiB (без copystat).
+
+    exclusive=True: dst должен быть новым файлом, иначе FileExistsError —
+    проверка существования и создание одним open('xb'), без гонки с exists().
+    Копия файла в самого себя — shutil.SameFileError, как у shutil.copy
+    (open(dst, 'wb') обнулил бы профиль до чтения).
+    """
+    if not exclusive:
+        try:
+            same = os.path.samefile(src, dst)
+        except OSError:
+            same = False  # dst ещё нет
+        if same:
+            raise shutil.SameFileError(f"{src!s} and {dst!s} are the same file")
+    with open(src, 'rb') as fsrc, open(dst, 'xb' if exclusive else 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+
+def _rename_file(src, dst):
+    """Переименовать src в dst, не перезаписывая существующий dst (FileExistsError).
+
+    Windows: os.rename сам отказывает, если цель существует. POSIX: rename()
+    молча перезаписывает цель, поэтому link + unlink; на ФС без жёстких ссылок
+    (FAT/exFAT, часть сетевых шар) — проверка существования и os.rename.
+    Тот же файл под другим регистром имени (нечувствительная к регистру ФС) —
+    просто os.rename.
+    """
+    if os.name == 'nt':
+        os.rename(src, dst)
+        return
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        if not os.path.samefile(src, dst):
+            raise
+        os.rename(src, dst)
+        return
+    except OSError:
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+
+class _PrefetchTask(QRunnable):
+    """Прогрев кэша _load_and_prepare для списка профилей в QThreadPool.
+
+    UI не трогает. Прерывается, когда счётчик поколений владельца
+    (gen_ref[0]) ушёл вперёд — список уже перечитан.
+    """
+
+    def __init__(self, paths, gen_ref, gen):
+        super().__init__()
+        self._paths = paths
+        self._gen_ref = gen_ref
+        self._gen = gen
+
+    def run(self):
+        for path_str in self._paths:
+            if self._gen_ref[0] != self._gen:
+                return
+            _load_prepared(Path(path_str))
+
+
+class _ProfileModel(QAbstractListModel):
+    """Список профилей: строки (имя, путь) без QListWidgetItem на каждый файл."""
+
+    PathRole = Qt.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows):
+        """Заменить содержимое целиком (один reset модели)."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name, path_str = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == self.PathRole:
+            return path_str
+        return None
 
 
 class PageProfiles(QWidget):
@@ -54,9 +196,12 @@ class PageProfiles(QWidget):
         list_label = QLabel("<b>Profiles:</b>")
         left_layout.addWidget(list_label)
 
-        self.profile_list = QListWidget()
-        self.profile_list.itemSelectionChanged.connect(self._on_selection_changed)
-        self.profile_list.itemDoubleClicked.connect(self._load_profile)
+        self.profile_model = _ProfileModel(self)
+        self.profile_list = QListView()
+        self.profile_list.setModel(self.profile_model)
+        self.profile_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.profile_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.profile_list.doubleClicked.connect(self._load_profile)
         left_layout.addWidget(self.profile_list)
 
         # Buttons for list
@@ -79,8 +224,12 @@ class PageProfiles(QWidget):
         preview_label = QLabel("<b>Preview:</b>")
         right_layout.addWidget(preview_label)
 
-        self.preview_text = QTextEdit()
+        # Простой построчный документ: для моноширинного read-only JSON
+        # rich-text модель QTextEdit не нужна
+        self.preview_text = QPlainTextEdit()
         self.preview_text.setReadOnly(True)
+        self.preview_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.preview_text.setStyleSheet("font-family: 'Consolas', monospace; font-size: 9pt;")
         self.preview_text.setPlaceholderText("Select a profile to preview...")
         right_layout.addWidget(self.preview_text)
 
@@ -130,32 +279,58 @@ class PageProfiles(QWidget):
         self.status_label = QLabel("Ready")
         root.addWidget(self.status_label)
 
+        # Отложенное превью выбранного профиля
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._do_preview)
+
+        # Поколение списка: _PrefetchTask прошлого _refresh_list останавливается
+        self._prefetch_gen = [0]
+
         # Initial refresh
         self._refresh_list()
 
     def _refresh_list(self):
         """Refresh profile list from directory."""
-        self.profile_list.clear()
-        self.preview_text.clear()
+        # Ключ кэша и так меняется с mtime; сброс — чтобы не держать удалённые файлы
+        _load_and_prepare.cache_clear()
+        self._prefetch_gen[0] += 1
+
+        # Один проход scandir: имя и путь строками, без Path на каждый файл
+        with os.scandir(profiles_dir()) as it:
+            profiles = [(e.name, e.path) for e in it
+                        if e.name.lower().endswith('.json') and e.is_file()]
+        profiles.sort()
+
+        # Один reset модели вместо QListWidgetItem + addItem на каждый файл
+        self.profile_model.set_rows([(name[:-5], path_str) for name, path_str in profiles])
 
-        pdir = profiles_dir()
-        profiles = sorted(pdir.glob("*.json"))
+        # Reset сбрасывает выделение без selectionChanged — кнопки и превью обновляем явно
+        self._on_selection_changed()
 
         if not profiles:
             self.status_label.setText("No profiles found")
             return
 
-        for profile_path in profiles:
-            item = QListWidgetItem(profile_path.stem)
-            item.setData(Qt.UserRole, str(profile_path))
-            self.profile_list.addItem(item)
-
         self.status_label.setText(f"Found {len(profiles)} profile(s)")
 
-    def _on_selection_changed(self):
+        # Пока пользователь смотрит на список — читаем и проверяем профили
+        # в фоне; больше размера lru-кэша прогревать бессмысленно
+        paths = [path_str for _name, path_str in profiles[:_load_and_prepare.cache_info().maxsize]]
+        QThreadPool.globalInstance().start(_PrefetchTask(paths, self._prefetch_gen, self._prefetch_gen[0]))
+
+    def _selected_path(self):
+        """Path выбранного профиля или None."""
+        indexes = self.profile_list.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        return Path(indexes[0].data(_ProfileModel.PathRole))
+
+    def _on_selection_changed(self, *_):
         """Update preview when selection changes."""
-        items = self.profile_list.selectedItems()
-        if not items:
+        path = self._selected_path()
+        if path is None:
+            self._preview_timer.stop()
             self.preview_text.clear()
             self.btn_load.setEnabled(False)
             self.btn_duplicate.setEnabled(False)
@@ -171,13 +346,37 @@ class PageProfiles(QWidget):
         self.btn_delete.setEnabled(True)
         self.btn_export.setEnabled(True)
 
-        # Load and preview
-        path = Path(items[0].data(Qt.UserRole))
-        data = load_json(path)
+        # Превью — после паузы: при листании стрелками разбираем только итоговый выбор
+        self._preview_timer.start(150)
+
+    def _do_preview(self):
+        """Load and preview the selected profile (debounced)."""
+        path = self._selected_path()
+        if path is None:
+            return
+
+        # Чтение, форматирование и validate_profile — в QThreadPool
+        task = BackgroundTask(_preview_task, path)
+        task.signals.finished.connect(self._on_preview_ready)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_preview_ready(self, result):
+        """Результат фонового превью (устаревший — для другого выбора — игнорируется)."""
+        if isinstance(result, Exception):
+            self.preview_text.setPlainText("Error loading profile")
+            self.status_label.setText(f"Error loading profile: {result}")
+            return
+        path, prepared = result
+        if path != self._selected_path():
+            return
+        if isinstance(prepared, Exception):
+            self.preview_text.setPlainText("Error loading profile")
+            self.status_label.setText(f"Error loading profile: {prepared}")
+            return
+
+        data, pretty, ok, msg = prepared
         if data:
-            import json
-            self.preview_text.setPlainText(json.dumps(data, indent=2, ensure_ascii=False))
-            ok, msg = validate_profile(data)
+            self.preview_text.setPlainText(pretty)
             if not ok:
                 self.status_label.setText(f"⚠️ Validation: {msg}")
             else:
@@ -188,23 +387,21 @@ class PageProfiles(QWidget):
 
     def _load_profile(self):
         """Load selected profile (emit signal)."""
-        items = self.profile_list.selectedItems()
-        if not items:
+        path = self._selected_path()
+        if path is None:
             return
-
-        path = Path(items[0].data(Qt.UserRole))
-        data = load_json(path)
+        data, _pretty, ok, msg = _load_prepared(path)
         if not data:
             QMessageBox.critical(self, "Load Error", "Failed to load profile")
             return
 
-        ok, msg = validate_profile(data)
         if not ok:
             QMessageBox.warning(self, "Validation Error", f"Profile validation failed:\n{msg}")
             return
 
         # Emit signal for other pages to catch
-        self.profile_loaded.emit(data)
+        # Копия: получатели могут менять профиль, а data лежит в кэше
+        self.profile_loaded.emit(copy.deepcopy(data))
         self.status_label.setText(f"Loaded: {path.name}")
         QMessageBox.information(self, "Profile Loaded",
                                f"Profile '{path.stem}' loaded.\n\n"
@@ -212,11 +409,9 @@ class PageProfiles(QWidget):
 
     def _duplicate_profile(self):
         """Duplicate selected profile."""
-        items = self.profile_list.selectedItems()
-        if not items:
+        path = self._selected_path()
+        if path is None:
             return
-
-        path = Path(items[0].data(Qt.UserRole))
         new_name, ok = QInputDialog.getText(
             self,
             "Duplicate Profile",
@@ -232,24 +427,20 @@ class PageProfiles(QWidget):
 
         new_path = profiles_dir() / new_name
 
-        if new_path.exists():
-            QMessageBox.warning(self, "Error", f"Profile '{new_name}' already exists")
-            return
-
         try:
-            shutil.copy(path, new_path)
+            _copy_file(path, new_path, exclusive=True)
             self._refresh_list()
             self.status_label.setText(f"Duplicated: {new_name}")
+        except FileExistsError:
+            QMessageBox.warning(self, "Error", f"Profile '{new_name}' already exists")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to duplicate:\n{e}")
 
     def _rename_profile(self):
         """Rename selected profile."""
-        items = self.profile_list.selectedItems()
-        if not items:
+        path = self._selected_path()
+        if path is None:
             return
-
-        path = Path(items[0].data(Qt.UserRole))
         new_name, ok = QInputDialog.getText(
             self,
             "Rename Profile",
@@ -264,26 +455,24 @@ class PageProfiles(QWidget):
             new_name += '.json'
 
         new_path = profiles_dir() / new_name
-
-        if new_path.exists():
-            QMessageBox.warning(self, "Error", f"Profile '{new_name}' already exists")
+        if new_path == path:
             return
 
         try:
-            path.rename(new_path)
+            _rename_file(path, new_path)
             self._refresh_list()
             self.status_label.setText(f"Renamed to: {new_name}")
+        except FileExistsError:
+            QMessageBox.warning(self, "Error", f"Profile '{new_name}' already exists")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to rename:\n{e}")
 
     def _delete_profile(self):
         """Delete selected profile."""
-        items = self.profile_list.selectedItems()
-        if not items:
+        path = self._selected_path()
+        if path is None:
             return
 
-        path = Path(items[0].data(Qt.UserRole))
-
         reply = QMessageBox.question(
             self,
             "Confirm Delete",
@@ -315,19 +504,20 @@ class PageProfiles(QWidget):
         source = Path(file_path)
         dest = profiles_dir() / source.name
 
-        if dest.exists():
-            reply = QMessageBox.question(
-                self,
-                "Overwrite?",
-                f"Profile '{source.name}' already exists. Overwrite?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            if reply == QMessageBox.No:
-                return
-
         try:
-            shutil.copy(source, dest)
+            try:
+                _copy_file(source, dest, exclusive=True)
+            except FileExistsError:
+                reply = QMessageBox.question(
+                    self,
+                    "Overwrite?",
+                    f"Profile '{source.name}' already exists. Overwrite?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.No
+                )
+                if reply == QMessageBox.No:
+                    return
+                _copy_file(source, dest)
             self._refresh_list()
             self.status_label.setText(f"Imported: {source.name}")
         except Exception as e:
@@ -335,12 +525,10 @@ class PageProfiles(QWidget):
 
     def _export_profile(self):
         """Export selected profile to external location."""
-        items = self.profile_list.selectedItems()
-        if not items:
+        path = self._selected_path()
+        if path is None:
             return
 
-        path = Path(items[0].data(Qt.UserRole))
-
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Profile",
@@ -352,13 +540,15 @@ class PageProfiles(QWidget):
             return
 
         try:
-            shutil.copy(path, file_path)
+            _copy_file(path, file_path)
             self.status_label.setText(f"Exported to: {file_path}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to export:\n{e}")
 
     def _migrate_legacy(self):
         """Migrate profiles from legacy location."""
+        from ...utils.migrate import migrate_legacy_profiles
+
         result = migrate_legacy_profiles()
 
         if result["found"] == 0:
@@ -8,13 +8,18 @@
 """
 
 import re
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import Tuple, Optional
 
 
 DEFAULT_FS_HZ = 1_024_000  # Fallback Fs (1024 кГц)
 
+# Шаблоны компилируются один раз при импорте
+_FS_RE = re.compile(r'^iq_(\d+)(?:_|\.)', re.IGNORECASE)  # iq_<число>(_|.)
+# Серия недопустимых символов и/или "_" -> один "_"
+_SEPARATOR_RUN_RE = re.compile(r'[^a-zA-Z0-9\-]+')
+
 
 def parse_fs_from_filename(filename: str) -> Tuple[int, bool]:
     """Извлекает частоту дискретизации (Fs) из имени файла .cf32.
@@ -42,10 +47,8 @@ def parse_fs_from_filename(filename: str) -> Tuple[int, bool]:
     # Убираем путь, оставляем только имя файла
     basename = Path(filename).name
 
-    # Regex: iq_<число>(_|.)
     # Ищем первое число после "iq_"
-    pattern = r'^iq_(\d+)(?:_|\.)'
-    match = re.search(pattern, basename, re.IGNORECASE)
+    match = _FS_RE.search(basename)
 
     if match:
         fs_khz = int(match.group(1))
@@ -85,15 +88,14 @@ def generate_cf32_name(
     # Если custom_name не задано - генерируем timestamp
     if not custom_name:
         if add_timestamp:
-            timestamp = datetime.utcnow().strftime("utc%Y%m%d_%H%M%S")
+            timestamp = time.strftime("utc%Y%m%d_%H%M%S", time.gmtime())
             custom_name = timestamp
         else:
             custom_name = "output"
 
     # Проверка idempotency: если custom_name уже начинается с iq_<FSk>_
     # то не дублируем
-    pattern = rf'^iq_{fs_khz}_'
-    if re.match(pattern, custom_name, re.IGNORECASE):
+    if custom_name.lower().startswith(f"iq_{fs_khz}_"):
         # Уже есть префикс, используем как есть
         return f"{custom_name}.cf32" if not custom_name.endswith('.cf32') else custom_name
 
@@ -117,14 +119,13 @@ def sanitize_custom_name(name: str) -> str:
         'my_signal_1'
     """
     # Убираем расширение .cf32 если есть
-    name = name.replace('.cf32', '').replace('.CF32', '')
+    if name[-5:].lower() == '.cf32':
+        name = name[:-5]
 
-    # Заменяем недопустимые символы на _
     # Разрешены: буквы, цифры, _, -
-    sanitized = re.sub(r'[^a-zA-Z0-9_\-]', '_', name)
-
-    # Убираем множественные подчёркивания
-    sanitized = re.sub(r'_+', '_', sanitized)
+    # Один проход: каждая серия недопустимых символов вместе с соседними "_"
+    # становится одним "_" (то же, что замена на _ и схлопывание "_+")
+    sanitized = _SEPARATOR_RUN_RE.sub('_', name)
 
     # Убираем подчёркивания в начале/конце
     sanitized = sanitized.strip('_')
@@ -1,4 +1,5 @@
 """Миграция профилей из старых мест в rfgen/profiles/."""
+import os
 import shutil
 from pathlib import Path
 from typing import Any, Optional
@@ -17,7 +18,7 @@ def get_legacy_profiles_dir() -> Optional[Path]:
     repo_root = pkg_root().parent
     legacy_dir = repo_root / "profiles"
 
-    if legacy_dir.exists() and legacy_dir.is_dir():
+    if legacy_dir.is_dir():
         return legacy_dir
     return None
 
@@ -60,45 +61,51 @@ def migrate_legacy_profiles(dry_run: bool = False) -> dict[str, Any]:
         result["errors"].append("Legacy profiles directory not found")
         return result
 
-    # Ищем все .json файлы
-    json_files = list(legacy_dir.glob("*.json"))
+    # Ищем все .json файлы: один проход scandir, тип файла из DirEntry без stat()
+    with os.scandir(legacy_dir) as it:
+        json_files = [(e.name, e.path) for e in it
+                      if e.name.endswith('.json') and e.is_file()]
     result["found"] = len(json_files)
 
     if result["found"] == 0:
         return result
 
     target_dir = profiles_dir()
+    # Занятые имена в rfgen/profiles/ — одним listdir вместо exists() на каждый файл
+    # (normcase: на Windows сравнение имён без учёта регистра, как у exists())
+    taken = {os.path.normcase(n) for n in os.listdir(target_dir)}
 
-    for json_file in json_files:
+    for name, path_str in json_files:
         try:
             # Загружаем
-            data = load_json(json_file)
+            data = load_json(path_str)
             if data is None:
-                result["errors"].append(f"Failed to load: {json_file.name}")
+                result["errors"].append(f"Failed to load: {name}")
                 continue
 
             # Мигрируем формат
             migrated_data = migrate_legacy_profile(data)
 
             # Определяем целевое имя файла
-            target_name = json_file.name
-            target_path = target_dir / target_name
+            target_name = name
 
             # Проверяем конфликт
-            if target_path.exists():
+            if os.path.normcase(target_name) in taken:
                 # Добавляем суффикс
-                stem = target_path.stem
-                target_path = target_dir / f"{stem}_migrated.json"
+                target_name = f"{name[:-5]}_migrated.json"
 
                 # Если и это занято - пропускаем
-                if target_path.exists():
+                if os.path.normcase(target_name) in taken:
                     result["skipped"] += 1
-                    result["errors"].append(f"Skipped (already exists): {json_file.name}")
+                    result["errors"].append(f"Skipped (already exists): {name}")
                     continue
 
+            target_path = target_dir / target_name
+
             # Сохраняем
             if not dry_run:
                 if save_json(target_path, migrated_data):
+                    taken.add(os.path.normcase(target_name))
                     result["migrated"] += 1
                     result["files"].append(target_path.name)
                 else:
@@ -108,7 +115,7 @@ def migrate_legacy_profiles(dry_run: bool = False) -> dict[str, Any]:
                 result["files"].append(f"[DRY RUN] {target_path.name}")
 
         except Exception as e:
-            result["errors"].append(f"Error processing {json_file.name}: {e}")
+            result["errors"].append(f"Error processing {name}: {e}")
 
     return result
 
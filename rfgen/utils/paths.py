@@ -1,7 +1,12 @@
-"""Централизованное управление путями проекта rfgen."""
+"""Централизованное управление путями проекта rfgen.
+
+Результаты кэшируются на процесс: resolve() и mkdir() выполняются один раз.
+"""
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
 def pkg_root() -> Path:
     """Возвращает корневой каталог пакета rfgen/.
 
@@ -11,22 +16,26 @@ def pkg_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+@lru_cache(maxsize=None)
+def _ensured(sub: str) -> Path:
+    """pkg_root()/sub, каталог создаётся при первом обращении."""
+    p = pkg_root() / sub
+    # Один mkdir: родитель (сам пакет) существует; exist_ok пропускает
+    # только каталог — файл с тем же именем даёт FileExistsError
+    p.mkdir(exist_ok=True)
+    return p
+
+
 def profiles_dir() -> Path:
     """Возвращает каталог для профилей: rfgen/profiles/."""
-    p = pkg_root() / "profiles"
-    p.mkdir(parents=True, exist_ok=True)
-    return p
+    return _ensured("profiles")
 
 
 def out_dir() -> Path:
     """Возвращает каталог для выходных файлов (IQ): rfgen/out/."""
-    p = pkg_root() / "out"
-    p.mkdir(parents=True, exist_ok=True)
-    return p
+    return _ensured("out")
 
 
 def logs_dir() -> Path:
     """Возвращает каталог для логов: rfgen/logs/."""
-    p = pkg_root() / "logs"
-    p.mkdir(parents=True, exist_ok=True)
-    return p
+    return _ensured("logs")
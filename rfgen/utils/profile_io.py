@@ -1,49 +1,81 @@
 """Работа с профилями: валидация, дефолты, загрузка/сохранение."""
 import json
+import os
+import re
+import sys
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson  # необязательно: ускоряет чтение/запись и превью профилей
+except ImportError:
+    orjson = None
+
 PROFILE_SCHEMA_VERSION = 1
 
+# "standard": "<id>" в начале файла (save_json пишет его вторым ключом)
+_STANDARD_RE = re.compile(rb'"standard"\s*:\s*"([^"\\]*)"')
+
+# Схема validate_profile: собирается один раз при импорте и общая для всех страниц
+_REQUIRED_BLOCKS = ("device", "modulation", "pattern", "schedule")
+# Допустимые значения — frozenset: проверка по хэшу, а не перебором
+_VALID_BACKENDS = frozenset({"hackrf", "fileout", "pluto"})
+_VALID_MODULATIONS = frozenset({"None", "AM", "FM", "PM", "BPSK", "GMSK", "FSK"})
+_VALID_PATTERNS = frozenset({"Tone", "Sweep", "Noise", "FF00", "F0F0", "3333", "5555",
+                             "406", "121", "AIS", "DSC_VHF", "DSC_HF", "NAVTEX"})
+_VALID_STANDARDS = frozenset({"basic", "ais", "c406", "dsc_vhf", "dsc_hf", "navtex", "121"})
+# Численные поля device: (ключ, минимум, максимум, текст ошибки)
+_DEVICE_RANGES = (
+    ("fs_tx", 100_000, 20_000_000, "fs_tx must be 100kHz-20MHz"),
+    ("tx_gain_db", 0, 47, "tx_gain_db must be 0-47"),
+    ("target_hz", 0, 7_250_000_000, "target_hz must be 0-7.25GHz"),
+)
+
+
+# Дефолтный профиль: собирается один раз при импорте. Двухуровневый
+# (блоки — плоские dict с неизменяемыми значениями), поэтому defaults()
+# копирует только сами блоки, без copy.deepcopy
+_DEFAULTS_TEMPLATE = {
+    "schema": PROFILE_SCHEMA_VERSION,
+    "name": "Unnamed Profile",
+    "standard": "basic",
+    "standard_params": {},
+    "modulation": {
+        "type": "FM",
+        "deviation_hz": 5000,
+        "pm_index": 1.0,
+        "am_depth": 0.5
+    },
+    "pattern": {
+        "type": "Tone",
+        "tone_hz": 1000,
+        "bitrate_bps": 9600
+    },
+    "schedule": {
+        "mode": "loop",
+        "repeat": 1,
+        "gap_s": 0.0,
+        "duration_s": 1.0
+    },
+    "device": {
+        "backend": "hackrf",
+        "fs_tx": 2000000,
+        "tx_gain_db": 30,
+        "pa": False,
+        "target_hz": 162025000,
+        "if_offset_hz": 0,
+        "freq_corr_hz": 0
+    },
+    "_meta": {
+        "created_utc": "",
+        "notes": ""
+    }
+}
+
 
 def defaults() -> dict[str, Any]:
-    """Возвращает дефолтные значения для всех блоков профиля."""
-    return {
-        "schema": PROFILE_SCHEMA_VERSION,
-        "name": "Unnamed Profile",
-        "standard": "basic",
-        "standard_params": {},
-        "modulation": {
-            "type": "FM",
-            "deviation_hz": 5000,
-            "pm_index": 1.0,
-            "am_depth": 0.5
-        },
-        "pattern": {
-            "type": "Tone",
-            "tone_hz": 1000,
-            "bitrate_bps": 9600
-        },
-        "schedule": {
-            "mode": "loop",
-            "repeat": 1,
-            "gap_s": 0.0,
-            "duration_s": 1.0
-        },
-        "device": {
-            "backend": "hackrf",
-            "fs_tx": 2000000,
-            "tx_gain_db": 30,
-            "pa": False,
-            "target_hz": 162025000,
-            "if_offset_hz": 0,
-            "freq_corr_hz": 0
-        },
-        "_meta": {
-            "created_utc": "",
-            "notes": ""
-        }
-    }
+    """Возвращает дефолтные значения для всех блоков профиля (новый dict на каждый вызов)."""
+    return {k: v.copy() if type(v) is dict else v for k, v in _DEFAULTS_TEMPLATE.items()}
 
 
 def validate_profile(p: dict) -> tuple[bool, str]:
@@ -57,8 +89,7 @@ def validate_profile(p: dict) -> tuple[bool, str]:
         return False, "Profile must be a dictionary"
 
     # Проверяем обязательные блоки
-    required_blocks = ["device", "modulation", "pattern", "schedule"]
-    for block in required_blocks:
+    for block in _REQUIRED_BLOCKS:
         if block not in p:
             return False, f"Missing required block: '{block}'"
 
@@ -68,44 +99,35 @@ def validate_profile(p: dict) -> tuple[bool, str]:
         return False, "Missing device.backend"
 
     backend = device.get("backend")
-    if backend not in ("hackrf", "fileout", "pluto"):
+    if type(backend) is not str or backend not in _VALID_BACKENDS:
         return False, f"Invalid backend: '{backend}'"
 
     # Валидация численных параметров device
-    try:
-        fs_tx = int(device.get("fs_tx", 0))
-        if not (100_000 <= fs_tx <= 20_000_000):
-            return False, f"fs_tx must be 100kHz-20MHz, got {fs_tx}"
-
-        tx_gain = int(device.get("tx_gain_db", 0))
-        if not (0 <= tx_gain <= 47):
-            return False, f"tx_gain_db must be 0-47, got {tx_gain}"
-
-        target_hz = int(device.get("target_hz", 0))
-        if not (0 <= target_hz <= 7_250_000_000):
-            return False, f"target_hz must be 0-7.25GHz, got {target_hz}"
-    except (ValueError, TypeError) as e:
-        return False, f"Invalid numeric value in device: {e}"
+    for key, lo, hi, err in _DEVICE_RANGES:
+        value = device.get(key, 0)
+        if type(value) is not int:  # из JSON обычно уже int — приведение не нужно
+            try:
+                value = int(value)
+            except (ValueError, TypeError, OverflowError) as e:
+                return False, f"Invalid numeric value in device: {e}"
+        if not (lo <= value <= hi):
+            return False, f"{err}, got {value}"
 
     # Валидация modulation type
     mod = p.get("modulation", {})
     mod_type = mod.get("type", "None")
-    valid_modulations = ("None", "AM", "FM", "PM", "BPSK", "GMSK", "FSK")
-    if mod_type not in valid_modulations:
+    if type(mod_type) is not str or mod_type not in _VALID_MODULATIONS:
         return False, f"Invalid modulation type: '{mod_type}'"
 
     # Валидация pattern type
     pattern = p.get("pattern", {})
     pattern_type = pattern.get("type", "Tone")
-    valid_patterns = ("Tone", "Sweep", "Noise", "FF00", "F0F0", "3333", "5555",
-                     "406", "121", "AIS", "DSC_VHF", "DSC_HF", "NAVTEX")
-    if pattern_type not in valid_patterns:
+    if type(pattern_type) is not str or pattern_type not in _VALID_PATTERNS:
         return False, f"Invalid pattern type: '{pattern_type}'"
 
     # Валидация standard
     standard = p.get("standard", "basic")
-    valid_standards = ("basic", "ais", "c406", "dsc_vhf", "dsc_hf", "navtex", "121")
-    if standard not in valid_standards:
+    if type(standard) is not str or standard not in _VALID_STANDARDS:
         return False, f"Invalid standard: '{standard}'"
 
     return True, ""
@@ -122,16 +144,25 @@ def apply_defaults(p: dict) -> dict:
     """
     result = defaults()
 
-    # Рекурсивно обновляем вложенные словари
-    def deep_update(base: dict, update: dict) -> dict:
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                base[key] = deep_update(base[key].copy(), value)
-            else:
-                base[key] = value
-        return base
+    # Шаблон двухуровневый: блоки — свежие копии из defaults(), их значения
+    # не dict, так что глубже первого уровня сливать нечего
+    for key, value in p.items():
+        base = result.get(key)
+        if type(base) is dict and isinstance(value, dict):
+            base.update(value)
+        else:
+            result[key] = value
+    return result
+
 
-    return deep_update(result, p)
+def _interned_dict(pairs) -> dict:
+    """object_pairs_hook для json: ключи через sys.intern.
+
+    Одни и те же ключи схемы ("device", "modulation", ...) во всех
+    загруженных профилях — общие объекты str, а не копии на каждый файл.
+    orjson делает то же своим кэшем ключей.
+    """
+    return {sys.intern(k): v for k, v in pairs}
 
 
 def load_json(path: Path) -> Optional[dict]:
@@ -141,23 +172,84 @@ def load_json(path: Path) -> Optional[dict]:
         dict если успешно, None при ошибке
     """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Байты одним read() без текстового слоя: и orjson, и json разбирают bytes.
+        # buffering=0: FileIO.readall читает файл по размеру из fstat,
+        # BufferedReader для одного чтения не нужен
+        with open(path, 'rb', buffering=0) as f:
+            raw = f.read()
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity и прочие расширения, которые понимает только json
+        return json.loads(raw, object_pairs_hook=_interned_dict)
+    except Exception:
+        return None
+
+
+def peek_standard(path: Path, limit: int = 256) -> Optional[str]:
+    """Читает поле "standard" из начала JSON файла без полного парсинга.
+
+    Используется для быстрого отсева чужих профилей до вызова load_json().
+
+    Returns:
+        Значение "standard" если найдено в первых limit байтах,
+        None если не найдено или файл не читается
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(limit)
     except Exception:
         return None
+    match = _STANDARD_RE.search(head)
+    if match is None:
+        return None
+    return match.group(1).decode('utf-8', errors='replace')
+
+
+def _dumps_pretty_bytes(data: Any) -> bytes:
+    """dumps_pretty в UTF-8 байтах: orjson выдаёт bytes сразу, без decode/encode."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # тип, который orjson не сериализует (например, int > 64 бит)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def dumps_pretty(data: Any) -> str:
+    """JSON с отступом 2 и без экранирования не-ASCII (формат файлов профилей).
+
+    Через orjson, если он установлен; иначе json.dumps(indent=2, ensure_ascii=False).
+    """
+    if orjson is not None:
+        return _dumps_pretty_bytes(data).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
 
 
 def save_json(path: Path, data: dict) -> bool:
     """Сохраняет словарь в JSON файл.
 
+    Запись атомарная: соседний <path>.tmp одним write, затем os.replace —
+    при сбое посреди записи прежний файл профиля остаётся целым.
+
     Returns:
         True если успешно, False при ошибке
     """
+    tmp = os.fspath(path) + ".tmp"
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        raw = _dumps_pretty_bytes(data)
+        with open(tmp, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
         return True
     except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
         return False
 
 
@@ -184,12 +276,14 @@ def migrate_legacy_profile(p: dict) -> dict:
     # Определяем standard из контекста (пока всегда basic для старых)
     result["standard"] = p.get("standard", "basic")
 
-    # Копируем блоки если есть
-    for block in ("device", "modulation", "pattern", "schedule"):
-        if block in p:
-            for key, value in p[block].items():
-                if key in result[block]:
-                    result[block][key] = value
+    # Копируем блоки если есть: только ключи, известные схеме (пересечение)
+    for block in _REQUIRED_BLOCKS:
+        src = p.get(block)
+        if type(src) is not dict:
+            continue
+        dst = result[block]
+        for key in dst.keys() & src.keys():
+            dst[key] = src[key]
 
     # Добавляем schema
     result["schema"] = PROFILE_SCHEMA_VERSION